@@ -18,7 +18,8 @@ import logging
 from .types import (T_ReadHandle, T_ObjectHandle, T_NodePathHandle,
                     T_AttributeId, T_AttributeValueType, T_ContainerIterator,
                     T_TypeIndex, T_MessageHandle, T_ObjectWatcherHandle)
-from .util import singleton, declare_dll_functions, CApiDllLoadFailureError
+from .util import (singleton, declare_dll_functions, LazilyDeclaredDll,
+                   CApiDllLoadFailureError)
 from .wrapper_base import WrapperBase
 
 @singleton
@@ -31,7 +32,7 @@ class DataEngine(WrapperBase):
     self.is_connected = False
 
     try:
-      self.dll = ctypes.cdll.mdf_dataengine
+      self.dll = LazilyDeclaredDll("mdf_dataengine")
       self.log.debug("Loaded: mdf_dataengine.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_dataengine.dll")
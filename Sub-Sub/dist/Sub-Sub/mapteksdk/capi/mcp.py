@@ -17,7 +17,8 @@ import ctypes
 import logging
 from .types import T_SocketFileMutexHandle, \
  _Opaque, T_TextHandle, T_MessageHandle
-from .util import singleton, declare_dll_functions, CApiDllLoadFailureError
+from .util import (singleton, declare_dll_functions, LazilyDeclaredDll,
+                   CApiDllLoadFailureError)
 from .wrapper_base import WrapperBase
 
 @singleton
@@ -28,7 +29,7 @@ class Mcpd(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_mcp
+      self.dll = LazilyDeclaredDll("mdf_mcp")
       self.log.debug("Loaded: mdf_mcp.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_mcp.dll")
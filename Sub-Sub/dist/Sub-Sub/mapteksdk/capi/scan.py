@@ -18,7 +18,8 @@ import ctypes
 import logging
 from .types import T_TypeIndex, T_ObjectHandle, T_ReadHandle
 from .util import (singleton, declare_dll_functions, raise_if_version_too_old,
-                   CApiDllLoadFailureError, CApiUnknownError)
+                   CApiDllLoadFailureError, CApiUnknownError,
+                   LazilyDeclaredDll)
 from .wrapper_base import WrapperBase
 
 
@@ -30,7 +31,7 @@ class Scan(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_scan
+      self.dll = LazilyDeclaredDll("mdf_scan")
       self.log.debug("Loaded: mdf_scan.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_scan.dll")
@@ -16,7 +16,8 @@ this module. The contents may change at any time without warning.
 import ctypes
 import logging
 from .types import T_ObjectHandle
-from .util import singleton, declare_dll_functions, CApiDllLoadFailureError
+from .util import (singleton, declare_dll_functions, LazilyDeclaredDll,
+                   CApiDllLoadFailureError)
 from .wrapper_base import WrapperBase
 
 @singleton
@@ -27,7 +28,7 @@ class Selection(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_selection
+      self.dll = LazilyDeclaredDll("mdf_selection")
       self.log.debug("Loaded: mdf_selection.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_selection.dll")
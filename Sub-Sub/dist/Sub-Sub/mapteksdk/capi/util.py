@@ -79,6 +79,70 @@ def get_string(target_handle, dll_function):
     result = None
   return result
 
+class LazilyDeclaredDll(ctypes.CDLL):
+  """A dll which declares the return and argument types of its functions
+  the first time they are looked up.
+
+  The C API wrappers load their dll with this so that declare_dll_functions()
+  only needs to record the declarations. Most scripts only use a few of the
+  functions in each dll.
+
+  Parameters
+  ----------
+  name : str
+    The name of the dll to load. This is the same as the name passed to
+    ctypes.CDLL.
+
+  """
+  def __init__(self, name, *args, **kwargs):
+    super().__init__(name, *args, **kwargs)
+    self._function_declarations = {}
+    self._log = None
+
+  def declare_functions(self, declarations, log):
+    """Record the declarations of functions in the dll.
+
+    Functions which have already been looked up are declared immediately,
+    the others are declared when they are first looked up.
+
+    Parameters
+    ----------
+    declarations : dict
+      Dictionary of the declarations in the format expected by
+      declare_dll_functions(), excluding deleted functions.
+    log : log
+      Log to use to report functions which cannot be found.
+
+    """
+    self._function_declarations.update(declarations)
+    self._log = log
+
+    # ctypes caches each function on the dll after it has been looked up
+    # so these won't go through __getattr__ again.
+    for name in declarations.keys() & vars(self).keys():
+      dll_function = getattr(self, name)
+      dll_function.restype = declarations[name][0]
+      dll_function.argtypes = declarations[name][1]
+
+  def __getattr__(self, name):
+    # Read the declarations through __dict__ rather than as attributes, as
+    # looking up a missing attribute here would call __getattr__ again
+    # (e.g. before __init__() has set them).
+    declarations = self.__dict__.get("_function_declarations", {})
+    try:
+      dll_function = super().__getattr__(name)
+    except AttributeError:
+      log = self.__dict__.get("_log")
+      if log is not None and name in declarations:
+        log.debug(f"{name} not supported in DLL version.")
+      raise
+
+    parameters = declarations.get(name)
+    if parameters is not None:
+      dll_function.restype = parameters[0]
+      dll_function.argtypes = parameters[1]
+    return dll_function
+
 def declare_dll_functions(dll, functions, log):
   """Helper function for declaring all of the functions in
   a dll based on a dictionary of functions known to exist.
@@ -111,7 +175,17 @@ def declare_dll_functions(dll, functions, log):
   A function with a return type of the string constant "deleted"
   is ignored by this function.
 
+  If dll is a LazilyDeclaredDll, each function is only declared the first
+  time it is looked up on the dll.
+
   """
+  if isinstance(dll, LazilyDeclaredDll):
+    dll.declare_functions(
+      {name: parameters for name, parameters in functions.items()
+       if parameters[0] != "deleted"},
+      log)
+    return
+
   # For each function, declare its restype and argtypes based
   # on the values in the dictionary/tuple.
   for name, parameters in functions.items():
@@ -17,7 +17,8 @@ import ctypes
 import logging
 from .types import T_ReadHandle, T_TypeIndex, T_ObjectHandle
 from .util import (singleton, declare_dll_functions, raise_if_version_too_old,
-                   CApiUnknownError, CApiDllLoadFailureError)
+                   CApiUnknownError, CApiDllLoadFailureError,
+                   LazilyDeclaredDll)
 from .wrapper_base import WrapperBase
 
 @singleton
@@ -28,7 +29,7 @@ class Visualisation(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_visualisation
+      self.dll = LazilyDeclaredDll("mdf_visualisation")
       self.log.debug("Loaded: mdf_visualisation.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_visualisation.dll")
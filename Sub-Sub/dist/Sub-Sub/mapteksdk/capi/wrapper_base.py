@@ -253,8 +253,12 @@ class WrapperBase:
     generates the trivial wrapper functions which require no special
     handling.
 
+    The function is cached on the wrapper, so this is only called the first
+    time each function is used.
+
     """
     existing_function = getattr(self._dll(), self.method_prefix() + name)
     if existing_function:
+      setattr(self, name, existing_function)
       return existing_function
     raise AttributeError
@@ -122,6 +122,7 @@ class ChildView:
     List of children to be viewed in the form name, ID.
 
   """
+  __slots__ = ("children",)
 
   def __init__(self, children):
     self.children = children
@@ -13,6 +13,7 @@ in the future to support other types of scans.
 ###############################################################################
 import ctypes
 import logging
+import math
 import numpy as np
 
 from .base import Topology
@@ -29,6 +30,94 @@ from ..internal.util import cartesian_to_spherical, array_of_pointer
 
 log = logging.getLogger("mapteksdk.data.scan")
 
+# Converting a ctypes type to a numpy dtype is comparatively slow, so the
+# dtypes used for the arrays of a scan are converted once here.
+_FLOAT_DTYPE = np.dtype(ctypes.c_float)
+_DOUBLE_DTYPE = np.dtype(ctypes.c_double)
+_BOOL_DTYPE = np.dtype(ctypes.c_bool)
+_UINT16_DTYPE = np.dtype(ctypes.c_uint16)
+
+# Shared by new scans which do not have ranges or angles yet. It is read-only
+# so that it cannot be modified through one scan.
+_EMPTY_FLOAT_ARRAY = np.zeros(0, _FLOAT_DTYPE)
+_EMPTY_FLOAT_ARRAY.flags.writeable = False
+
+# Multiply by this to convert degrees to radians.
+_RADIANS_PER_DEGREE = math.pi / 180
+
+def _assign_fixed(value, length, dtype, description, scale=None):
+  """Returns value as an array of exactly length elements.
+
+  If value is already a contiguous one dimensional array of dtype with length
+  elements and scale is None, value itself is returned, so later changes to
+  it by the caller are seen through the returned array. Otherwise value is
+  copied into a new array, using the same broadcasting as assigning to a
+  slice of the array. For example, a scalar fills the array.
+
+  Parameters
+  ----------
+  value : array_like
+    The values to convert.
+  length : int
+    The number of values in the returned array.
+  dtype : type
+    The type of the returned array.
+  description : str
+    Description of the values to use in the error message.
+  scale : float
+    If not None, the values are multiplied by this as they are copied.
+
+  Returns
+  -------
+  ndarray
+    One dimensional array of length values of the specified type.
+    If value is already such an array and scale is None, it is returned
+    without being copied.
+
+  Raises
+  ------
+  DegenerateTopologyError
+    If value cannot be broadcast to length values or cannot be converted
+    to dtype.
+
+  """
+  if (scale is None and isinstance(value, np.ndarray)
+      and value.dtype == dtype and value.shape == (length,)
+      and value.flags.c_contiguous):
+    return value
+  result = np.empty(length, dtype)
+  try:
+    if scale is None:
+      result[:] = value
+    else:
+      result[:] = np.asarray(value, dtype=np.float64) * scale
+  except ValueError as error:
+    raise DegenerateTopologyError(
+      f"Scan requires {length} valid {description}. "
+      f"Given: {np.size(value)}") from error
+  return result
+
+def _copy_padded(destination, values):
+  """Copies values into destination, truncating or padding with zeroes.
+
+  This is equivalent to assigning trim_pad_1d_array(values,
+  destination.shape[0], 0) to destination, except that no intermediate
+  array is created when values is already an array.
+
+  Parameters
+  ----------
+  destination : ndarray
+    One dimensional array to copy the values into.
+  values : array_like
+    The values to copy. Values beyond the length of destination are
+    ignored.
+
+  """
+  values = np.asarray(values).reshape(-1)
+  count = min(values.shape[0], destination.shape[0])
+  np.copyto(destination[:count], values[:count], casting="unsafe")
+  destination[count:] = 0
+
 class Scan(Topology, PointProperties, CellProperties, RotationMixin):
   """Class optimised for storing scans made by 3D laser scanners.
 
@@ -255,6 +344,9 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     self.__point_validity = None
     self.__is_column_major = None
     self.__point_count = None
+    # True if the major and minor dimension counts of a new scan were
+    # specified in the constructor.
+    self.__dimensions_known = False
     if self.__is_new_scan and dimensions is not None:
       major_count = int(dimensions[0])
       minor_count = int(dimensions[1])
@@ -264,12 +356,17 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
           "Scans must contain at least one row and column.")
       self.__major_dimension_count = major_count
       self.__minor_dimension_count = minor_count
-      initial_validity = np.full((self.cell_point_count), True, ctypes.c_bool)
+      self.__dimensions_known = True
       if point_validity is not None:
+        initial_validity = np.empty(self.cell_point_count, _BOOL_DTYPE)
         initial_validity[:] = point_validity
-      initial_validity.flags.writeable = False
-      self.__point_count = np.count_nonzero(initial_validity)
-      self.__point_validity = initial_validity
+        initial_validity.flags.writeable = False
+        self.__point_count = np.count_nonzero(initial_validity)
+        self.__point_validity = initial_validity
+      else:
+        # Every point is valid. cell_point_validity provides the validity
+        # without storing it.
+        self.__point_count = self.cell_point_count
     if dimensions is None and point_validity is not None:
       raise RuntimeError("point_validity requires dimensions to be set.")
 
@@ -282,6 +379,71 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     """
     return ScanAPI().ScanType()
 
+  @classmethod
+  def from_spherical(cls, dimensions=None, *, point_ranges, horizontal_angles,
+                     vertical_angles, origin=None, max_range=None,
+                     point_validity=None):
+    """Creates a new scan from spherical coordinates.
+
+    This is equivalent to constructing a new scan and then assigning each
+    of the arguments to the corresponding property. Each array is
+    converted and checked against the dimensions once.
+
+    Parameters
+    ----------
+    dimensions : iterable
+      The major and minor dimension counts of the scan. If None, the scan
+      will have one row with one column for each point.
+    point_ranges : array_like
+      The distance of each valid point from the origin.
+    horizontal_angles : array_like
+      The horizontal angle of each point in radians.
+    vertical_angles : array_like
+      The vertical angle of each point in radians.
+    origin : array_like
+      The origin of the scan. If None, it will be [0, 0, 0].
+    max_range : float
+      The max range of the scan. If None, it will be the largest range.
+    point_validity : array_like
+      Which points in the scan are valid. This requires dimensions.
+
+    Returns
+    -------
+    Scan
+      The new scan. It must be added to the Project to save it.
+
+    Raises
+    ------
+    DegenerateTopologyError
+      If dimensions is given and the ranges or angles do not have the
+      required number of values.
+
+    Examples
+    --------
+    Create a scan with two rows and two columns of points.
+
+    >>> from mapteksdk.project import Project
+    >>> from mapteksdk.data import Scan
+    >>> project = Project()
+    >>> scan = Scan.from_spherical(
+    ...     (2, 2),
+    ...     point_ranges=[10.1, 10.3, 9.8, 10.0],
+    ...     horizontal_angles=[-0.1, 0.1, -0.1, 0.1],
+    ...     vertical_angles=[-0.1, -0.1, 0.1, 0.1])
+    >>> with project.new("scans/from_spherical", scan):
+    ...     pass
+
+    """
+    scan = cls(dimensions=dimensions, point_validity=point_validity)
+    scan.point_ranges = point_ranges
+    scan.horizontal_angles = horizontal_angles
+    scan.vertical_angles = vertical_angles
+    if origin is not None:
+      scan.origin = origin
+    if max_range is not None:
+      scan.max_range = max_range
+    return scan
+
   @property
   def point_count(self):
     """Returns the number of points.
@@ -297,17 +459,21 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     of points in the points property.
 
     """
-    # Use the point count for non-new scans.
+    # Use the point count for non-new scans. This is read once and kept
+    # until the properties are invalidated.
     if not self.__is_new_scan:
-      return super().point_count
+      if self.__point_count is None:
+        self.__point_count = super().point_count
+      return self.__point_count
     # If the user has specified the point_validity, use the count of
     # valid points.
     if self.__point_count is not None:
       return self.__point_count
     # The dimensions were unspecified, but the user has set points.
     # Assume all points are valid.
-    if super().point_count != 0:
-      return super().point_count
+    point_count = super().point_count
+    if point_count != 0:
+      return point_count
     # The dimensions were unspecified, but the user has set ranges/vertical/
     # horizontal angles. Assume all points are valid.
     # The angle count is considered more important than the range count.
@@ -329,7 +495,10 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     assignment and operations which work in-place on the array.
 
     If the dimensions were specified in the constructor, then this must
-    have one value per valid point.
+    have one value per valid point. Assigning a contiguous array of 32 bit
+    floats with that many values stores the array itself rather than a copy,
+    so changes made to that array before save() is called will change the
+    ranges of the scan. Assign a copy of the array to avoid this.
 
     When save() is called, if there are less point_ranges than
     vertical_angles or horizontal_angles the ranges will be padded with zeroes.
@@ -355,7 +524,7 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     """
     if self.__ranges is None:
       if self.__is_new_scan:
-        self.__ranges = np.zeros(0, ctypes.c_float)
+        self.__ranges = _EMPTY_FLOAT_ARRAY
       else:
         self.__ranges = self._get_ranges()
     return self.__ranges
@@ -369,15 +538,10 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
       self.__ranges = None
     else:
       if self.__dimensions_known:
-        self.__ranges = np.zeros(self.point_count, ctypes.c_float)
-        try:
-          self.__ranges[:] = value
-        except ValueError as error:
-          raise DegenerateTopologyError(
-            f"Scan requires {self.point_count} valid ranges. "
-            f"Given: {len(value)}") from error
+        self.__ranges = _assign_fixed(
+          value, self.point_count, _FLOAT_DTYPE, "ranges")
       else:
-        self.__ranges = np.array(value, dtype=ctypes.c_float).ravel()
+        self.__ranges = np.array(value, dtype=_FLOAT_DTYPE).ravel()
 
   @property
   def horizontal_angles(self):
@@ -390,7 +554,10 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     padded with zeroes to be the same length.
 
     If the dimensions were specified in the constructor, then this must
-    have cell_point_count values.
+    have cell_point_count values. Assigning a contiguous array of 32 bit
+    floats with that many values stores the array itself rather than a copy,
+    so changes made to that array before save() is called will change the
+    angles of the scan. Assign a copy of the array to avoid this.
 
     Raises
     ------
@@ -421,7 +588,7 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     """
     if self.__horizontal_angles is None:
       if self.__is_new_scan:
-        self.__horizontal_angles = np.array([])
+        self.__horizontal_angles = _EMPTY_FLOAT_ARRAY
       else:
         self.__horizontal_angles = self._get_horizontal_angles()
     return self.__horizontal_angles
@@ -430,20 +597,39 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
   def horizontal_angles(self, value):
     if not self.__is_new_scan:
       raise ReadOnlyError("Horizontal angles can only be set for new scans.")
-    if value is None:
-      self.__horizontal_angles = None
-    else:
-      if self.__dimensions_known:
-        self.__horizontal_angles = np.zeros(self.cell_point_count)
-        try:
-          self.__horizontal_angles[:] = value
-        except ValueError as error:
-          raise DegenerateTopologyError(
-            f"Scan requires {self.cell_point_count} valid horizontal angles. "
-            f"Given: {len(value)}") from error
-      else:
-        self.__horizontal_angles = np.array(value,
-                                            dtype=ctypes.c_float).ravel()
+    self.__horizontal_angles = self.__to_angles(value, "horizontal angles")
+
+  @property
+  def horizontal_angles_deg(self):
+    """The horizontal angles of the points in degrees.
+
+    Unlike horizontal_angles, this returns a new array each time it is
+    accessed. Changing the values in the returned array does not change
+    the scan, for example scan.horizontal_angles_deg[0] = 10 has no effect.
+    Assign to this property or to horizontal_angles instead.
+
+    Setting this is equivalent to setting horizontal_angles to the
+    values converted to radians, except that the values are converted
+    as they are copied instead of into a temporary array.
+
+    Raises
+    ------
+    ReadOnlyError
+      If attempting to set when the horizontal angles are read-only.
+
+    See Also
+    --------
+    horizontal_angles : The horizontal angles in radians.
+
+    """
+    return np.rad2deg(self.horizontal_angles)
+
+  @horizontal_angles_deg.setter
+  def horizontal_angles_deg(self, value):
+    if not self.__is_new_scan:
+      raise ReadOnlyError("Horizontal angles can only be set for new scans.")
+    self.__horizontal_angles = self.__to_angles(
+      value, "horizontal angles", _RADIANS_PER_DEGREE)
 
   @property
   def vertical_angles(self):
@@ -456,7 +642,10 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     padded with zeroes to be the same length.
 
     If the dimensions were specified in the constructor, then this must
-    have cell_point_count values.
+    have cell_point_count values. Assigning a contiguous array of 32 bit
+    floats with that many values stores the array itself rather than a copy,
+    so changes made to that array before save() is called will change the
+    angles of the scan. Assign a copy of the array to avoid this.
 
     Raises
     ------
@@ -487,7 +676,7 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     """
     if self.__vertical_angles is None:
       if self.__is_new_scan:
-        self.__vertical_angles = np.array([])
+        self.__vertical_angles = _EMPTY_FLOAT_ARRAY
       else:
         self.__vertical_angles = self._get_vertical_angles()
     return self.__vertical_angles
@@ -496,28 +685,73 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
   def vertical_angles(self, value):
     if not self.__is_new_scan:
       raise ReadOnlyError("Vertical angles can only be set for new scans.")
-    if value is None:
-      self.__vertical_angles = None
-    else:
-      if self.__dimensions_known:
-        self.__vertical_angles = np.zeros(self.cell_point_count)
-        try:
-          self.__vertical_angles[:] = value
-        except ValueError as error:
-          raise DegenerateTopologyError(
-            f"Scan requires {self.cell_point_count} valid vertical ranges. "
-            f"Given: {len(value)}") from error
-      else:
-        self.__vertical_angles = np.array(value, dtype=ctypes.c_float).ravel()
+    self.__vertical_angles = self.__to_angles(value, "vertical angles")
 
   @property
-  def __dimensions_known(self):
-    """Returns True if the major and minor dimension counts for the
-    scan are known.
+  def vertical_angles_deg(self):
+    """The vertical angles of the points in degrees.
+
+    Unlike vertical_angles, this returns a new array each time it is
+    accessed. Changing the values in the returned array does not change
+    the scan, for example scan.vertical_angles_deg[0] = 10 has no effect.
+    Assign to this property or to vertical_angles instead.
+
+    Setting this is equivalent to setting vertical_angles to the
+    values converted to radians, except that the values are converted
+    as they are copied instead of into a temporary array.
+
+    Raises
+    ------
+    ReadOnlyError
+      If attempting to set when the vertical angles are read-only.
+
+    See Also
+    --------
+    vertical_angles : The vertical angles in radians.
+
+    """
+    return np.rad2deg(self.vertical_angles)
+
+  @vertical_angles_deg.setter
+  def vertical_angles_deg(self, value):
+    if not self.__is_new_scan:
+      raise ReadOnlyError("Vertical angles can only be set for new scans.")
+    self.__vertical_angles = self.__to_angles(
+      value, "vertical angles", _RADIANS_PER_DEGREE)
+
+  def __to_angles(self, value, description, scale=None):
+    """Converts value to an array of angles for a new scan.
+
+    Parameters
+    ----------
+    value : array_like
+      The angles to convert. If None, None is returned.
+    description : str
+      Description of the angles to use in error messages.
+    scale : float
+      If not None, the angles are multiplied by this as they are copied.
+
+    Returns
+    -------
+    ndarray
+      The angles, or None if value is None.
+
+    Raises
+    ------
+    DegenerateTopologyError
+      If the dimensions were passed to the constructor and value does not
+      contain cell_point_count values.
 
     """
-    return self.__major_dimension_count is not None and \
-           self.__major_dimension_count is not None
+    if value is None:
+      return None
+    if self.__dimensions_known:
+      return _assign_fixed(
+        value, self.cell_point_count, _FLOAT_DTYPE, description, scale)
+    angles = np.array(value, dtype=_FLOAT_DTYPE).ravel()
+    if scale is not None:
+      np.multiply(angles, scale, out=angles, casting="unsafe")
+    return angles
 
   @property
   def major_dimension_count(self):
@@ -657,11 +891,12 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
 
   @origin.setter
   def origin(self, new_origin):
-    if new_origin is None:
-      self.__origin = np.array([0, 0, 0], ctypes.c_double)
-    else:
-      self.__origin = trim_pad_1d_array(
-        new_origin, 3, 0).astype(ctypes.c_double)
+    origin = np.zeros(3, _DOUBLE_DTYPE)
+    if new_origin is not None:
+      # Copy at most three values, leaving any missing values as zero.
+      values = np.asarray(new_origin, _DOUBLE_DTYPE).ravel()[:3]
+      origin[:values.shape[0]] = values
+    self.__origin = origin
 
   @property
   def max_range(self):
@@ -683,7 +918,8 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     """
     if self.__max_range is None:
       if self.__is_new_scan:
-        self.__max_range = max(self.point_ranges, default=0)
+        ranges = self.point_ranges
+        self.__max_range = float(ranges.max()) if ranges.size else 0.0
       else:
         self.__max_range = self._get_max_range()
     return self.__max_range
@@ -783,12 +1019,11 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
 
     """
     if self.__point_validity is None:
-      if not self.__is_new_scan:
-        self.__point_validity = self._get_point_validity()
-      else:
-        self.__point_validity = np.full((self.cell_point_count),
-                                        True,
-                                        ctypes.c_bool)
+      if self.__is_new_scan:
+        # All points of the scan are valid. Return a read-only view of a
+        # single True value rather than allocating one for every point.
+        return np.broadcast_to(np.True_, (self.cell_point_count,))
+      self.__point_validity = self._get_point_validity()
     return self.__point_validity
 
   @property
@@ -800,6 +1035,9 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     integer and should be between 0 and 65535 (inclusive). If the
     value is outside of this range, integer overflow will occur.
 
+    Assigning a contiguous array of 16 bit unsigned integers stores a view
+    of that array rather than a copy.
+
     """
     if self.__point_intensity is None:
       self.__point_intensity = self._get_intensity()
@@ -807,8 +1045,8 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
 
   @point_intensity.setter
   def point_intensity(self, new_intensity):
-    self.__point_intensity = np.array(new_intensity,
-                                      dtype=ctypes.c_uint16).ravel()
+    self.__point_intensity = np.asarray(new_intensity,
+                                        dtype=_UINT16_DTYPE).ravel()
 
   @property
   def is_column_major(self):
@@ -834,15 +1072,17 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
       if self.__is_new_scan:
         # If the user has set points, convert them to ranges and angles so
         # that they can be saved.
-        if super().point_count != 0:
+        point_count = self.point_count
+        given_point_count = super().point_count
+        if given_point_count != 0:
           if self.__origin is None:
             self.origin = np.mean(self.points, axis=0)
 
           # Ensure we have the correct number of points.
-          if self.point_count != super().point_count:
+          if point_count != given_point_count:
             raise ValueError(
-              f"Scan requires {self.point_count} valid points. "
-              f"Given: {self.point_count}")
+              f"Scan requires {point_count} valid points. "
+              f"Given: {given_point_count}")
 
           spherical_coordinates = cartesian_to_spherical(self.points,
                                                          self.origin)
@@ -850,26 +1090,33 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
           # already correctly formatted.
           self.__ranges = spherical_coordinates[0]
 
-          # The above call will only generate angles for valid points,
-          # however the angles arrays must have values for invalid points.
-          # This allocates an array of nan and writes the valid values to
-          # the locations for the valid points.
-          horizontal_angles = np.full((self.cell_point_count),
-                                       np.nan,
-                                       ctypes.c_float)
-          horizontal_angles[self.cell_point_validity] = spherical_coordinates[1]
+          if self.__point_validity is None:
+            # Every point is valid, so there is exactly one angle per point.
+            horizontal_angles = spherical_coordinates[1].astype(_FLOAT_DTYPE)
+            vertical_angles = spherical_coordinates[2].astype(_FLOAT_DTYPE)
+          else:
+            # The above call will only generate angles for valid points,
+            # however the angles arrays must have values for invalid points.
+            # This allocates an array of nan and writes the valid values to
+            # the locations for the valid points.
+            validity = self.__point_validity
+            cell_point_count = self.cell_point_count
+            horizontal_angles = np.full((cell_point_count),
+                                        np.nan,
+                                        _FLOAT_DTYPE)
+            horizontal_angles[validity] = spherical_coordinates[1]
+
+            vertical_angles = np.full((cell_point_count),
+                                      np.nan,
+                                      _FLOAT_DTYPE)
+            vertical_angles[validity] = spherical_coordinates[2]
           self.__horizontal_angles = horizontal_angles
-
-          vertical_angles = np.full((self.cell_point_count),
-                                    np.nan,
-                                    ctypes.c_float)
-          vertical_angles[self.cell_point_validity] = spherical_coordinates[2]
           self.__vertical_angles = vertical_angles
 
         # Ensure the ranges array has one valid value for each point.
-        if self.point_ranges.shape[0] != self.point_count:
+        if self.point_ranges.shape[0] != point_count:
           self.point_ranges = trim_pad_1d_array(self.point_ranges,
-                                                self.point_count,
+                                                point_count,
                                                 0)
 
         self._save_scan_points()
@@ -888,6 +1135,9 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
       self._save_point_properties()
       self._save_cell_properties()
       self._reconcile_changes()
+      # Keep the count of valid points which was saved so that it does not
+      # need to be read back from the Project.
+      self.__point_count = self.point_count
       self.__is_new_scan = False
     else:
       error = CannotSaveInReadOnlyModeError()
@@ -904,6 +1154,8 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     self.__minor_dimension_count = None
     self.__max_range = None
     self.__point_validity = None
+    if not self.__is_new_scan:
+      self.__point_count = None
     PointProperties._invalidate_properties(self)
 
   def _save_scan_points(self):
@@ -944,7 +1196,15 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
       True if the scan is column major, False if the scan is row major.
 
     """
-    c_point_validity = (ctypes.c_bool * (row_count * col_count))(*validity)
+    # Pass a pointer to a contiguous copy of the validity rather than
+    # building a ctypes array one element at a time. The array must stay
+    # referenced until SetScan() returns.
+    validity = np.ascontiguousarray(validity, dtype=_BOOL_DTYPE)
+    if validity.shape != (row_count * col_count,):
+      raise ValueError(
+        f"Scan requires {row_count * col_count} validity values. "
+        f"Given: {validity.size}")
+    c_point_validity = validity.ctypes.data_as(ctypes.POINTER(ctypes.c_bool))
 
     # Set the size of the scan.
     ScanAPI().SetScan(self._lock.lock,
@@ -1029,11 +1289,9 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     """
     c_ranges = array_of_pointer(ScanAPI().PointRangesBeginRW(self._lock.lock),
                                 self.point_ranges.shape[0] * 4,
-                                ctypes.c_float)
+                                _FLOAT_DTYPE)
 
-    c_ranges[:] = trim_pad_1d_array(ranges,
-                                    self.point_ranges.shape[0],
-                                    0).astype(ctypes.c_float, copy=False)
+    _copy_padded(c_ranges, ranges)
 
   def _save_horizontal_angles(self, horizontal_angles):
     """Saves the horizontal angles to the Project.
@@ -1047,11 +1305,8 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     c_horizontal_angles = array_of_pointer(
       ScanAPI().GridHorizontalAnglesBeginRW(self._lock.lock),
       self.cell_point_count * 4,
-      ctypes.c_float)
-    c_horizontal_angles[:] = trim_pad_1d_array(
-      horizontal_angles,
-      self.cell_point_count,
-      0).astype(ctypes.c_float, copy=False)
+      _FLOAT_DTYPE)
+    _copy_padded(c_horizontal_angles, horizontal_angles)
 
   def _save_vertical_angles(self, vertical_angles):
     """Saves the vertical angles to the Project.
@@ -1065,11 +1320,8 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     c_vertical_angles = array_of_pointer(
       ScanAPI().GridVerticalAnglesBeginRW(self._lock.lock),
       self.cell_point_count * 4,
-      ctypes.c_float)
-    c_vertical_angles[:] = trim_pad_1d_array(
-      vertical_angles,
-      self.cell_point_count,
-      0).astype(ctypes.c_float, copy=False)
+      _FLOAT_DTYPE)
+    _copy_padded(c_vertical_angles, vertical_angles)
 
   def _save_intensity(self, intensity):
     """Saves the point intensity to the Project.
@@ -1083,11 +1335,8 @@ class Scan(Topology, PointProperties, CellProperties, RotationMixin):
     c_intensity = array_of_pointer(
       ScanAPI().PointIntensityBeginRW(self._lock.lock),
       self.point_ranges.shape[0] * 2,
-      ctypes.c_uint16)
-    c_intensity[:] = trim_pad_1d_array(
-      intensity,
-      self.point_ranges.shape[0],
-      0).astype(ctypes.c_uint16, copy=False)
+      _UINT16_DTYPE)
+    _copy_padded(c_intensity, intensity)
 
   def _set_origin(self, new_origin):
     """Saves the scan origin to the Project."""
@@ -678,9 +678,11 @@ def _add_content_to_message(message, content):
       # Send the size
       append_single_value(message, ctypes.c_uint64, len(raw_value))
 
-      # Then send each of the values.
+      # Then send each of the values. How to convert them to the element
+      # type is only looked up once as it is the same for every element.
+      convert_element = getattr(element_type, 'convert_to', element_type)
       for sub_value in raw_value:
-        append_single_value(message, element_type, sub_value)
+        _append_value_to_message(message, convert_element(sub_value))
     elif issubclass(field_type, InlineMessage):
       _add_content_to_message(message, raw_value)
     elif issubclass(field_type, SubMessage):
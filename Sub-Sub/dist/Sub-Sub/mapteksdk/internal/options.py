@@ -86,6 +86,11 @@ class ProjectOptions:
     Default is False.
 
   """
+  __slots__ = ("project_path", "open_mode", "access_mode", "backend_type",
+               "proj_units", "mcpd_mode", "mcpd_path", "dll_path",
+               "account_broker_connector_path",
+               "account_broker_session_parameters", "allow_hidden_objects")
+
   def __init__(self,
                project_path,
                open_mode=ProjectOpenMode.OPEN_OR_CREATE,
@@ -108,17 +108,17 @@ def cartesian_to_spherical(points, origin=None):
     origin = np.array([0, 0, 0], dtype=ctypes.c_double)
   elif not isinstance(origin, np.ndarray):
     origin = np.array(origin, dtype=ctypes.c_double)
-  spherical = np.zeros((3, len(points)), dtype=ctypes.c_double)
+  spherical = np.empty((3, len(points)), dtype=ctypes.c_double)
   vector = points - origin
+  # The distance of each point from the z axis.
+  horizontal_distance = np.hypot(vector[:, 0], vector[:, 1])
   # Calculate the ranges. Out is used to perform the calculation in-place.
-  np.sqrt(np.square(vector[:, 0]) + np.square(vector[:, 1]) +
-          np.square(vector[:, 2]), out=spherical[0])
+  np.hypot(horizontal_distance, vector[:, 2], out=spherical[0])
   # Calculate the alphas.
   np.arctan2(vector[:, 0], vector[:, 1], out=spherical[1])
-  # Calculate the betas.
-  np.arcsin(np.divide(vector[:, 2], spherical[0], where=spherical[0] != 0),
-            out=spherical[2])
-  # The where spherical[0] != 0 is used to skip dividing by zero.
+  # Calculate the betas. This is equal to arcsin(z / range), but does not
+  # need to divide and is zero for points at the origin.
+  np.arctan2(vector[:, 2], horizontal_distance, out=spherical[2])
   return spherical
 
 def spherical_to_cartesian(ranges, alphas, betas, origin=None):
@@ -166,15 +166,20 @@ def spherical_to_cartesian(ranges, alphas, betas, origin=None):
     raise ValueError("Ranges, alphas and betas must have same shape")
   if np.min(ranges) < 0:
     raise ValueError("All ranges must be greater than zero.")
-  cartesians = np.zeros((ranges.shape[0], 3), dtype=ctypes.c_double)
-  rcos = ranges * np.cos(betas)
-  np.multiply(rcos, np.sin(alphas), out=cartesians[:, 0])
-  np.multiply(rcos, np.cos(alphas), out=cartesians[:, 1])
-  np.multiply(ranges, np.sin(betas), out=cartesians[:, 2])
+  cartesians = np.empty((ranges.shape[0], 3), dtype=ctypes.c_double)
+  # The trigonometric functions are written straight into the output and
+  # then scaled in-place so the only temporary is r * cos(beta).
+  rcos = np.cos(betas, dtype=ctypes.c_double)
+  rcos *= ranges
+  np.sin(alphas, out=cartesians[:, 0])
+  cartesians[:, 0] *= rcos
+  np.cos(alphas, out=cartesians[:, 1])
+  cartesians[:, 1] *= rcos
+  np.sin(betas, out=cartesians[:, 2])
+  cartesians[:, 2] *= ranges
 
   if origin is not None:
-    origin = np.array(origin)
-    cartesians = cartesians + origin
+    cartesians += origin
 
   return cartesians
 
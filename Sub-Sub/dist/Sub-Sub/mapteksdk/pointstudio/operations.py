@@ -16,7 +16,7 @@ surface, simplifying a surface, filtering points.
 ###############################################################################
 
 import enum
-import numpy
+import functools
 
 from mapteksdk.common import convert_to_rgba
 from mapteksdk.data.colourmaps import NumericColourMap
@@ -34,6 +34,12 @@ from mapteksdk.operations import (_decode_selection, TooOldForOperation,
 
 COMMAND_PREFIX = 'Maptek.PointStudio.Python.Commands'
 
+# Bound once as every operation formats at least one selection.
+_format_selection = RequestTransactionWithInputs.format_selection
+
+# The string form of a boolean input, indexed by the boolean.
+_BOOL_STR = ('false', 'true')
+
 class DistanceMeasurementTarget(enum.Enum):
   """If there are multiple objects to measure the distance to this specifies
   how it should be done."""
@@ -56,6 +62,35 @@ class TriangulationOutput(enum.Enum):
   RELIMIT_TO_POLYGON = 4  # The polygon will be specified separately.
 
 
+# The inputs which select each output of a topographic triangulation.
+_TRIANGULATION_OUTPUT_INPUTS = {
+  TriangulationOutput.SINGLE_SURFACE: (
+    ('singleSurface', 'true'),
+    ('singleSurfacePerObject', 'false'),
+    ('relimitToPolygon', 'false'),
+    ('splitAlongEdgeConstraints', 'false'),
+  ),
+  TriangulationOutput.SURFACE_PER_OBJECT: (
+    ('singleSurface', 'false'),
+    ('singleSurfacePerObject', 'true'),
+    ('relimitToPolygon', 'false'),
+    ('splitAlongEdgeConstraints', 'false'),
+  ),
+  TriangulationOutput.SPLIT_ALONG_EDGE_CONSTRAINTS: (
+    ('singleSurface', 'false'),
+    ('singleSurfacePerObject', 'false'),
+    ('relimitToPolygon', 'false'),
+    ('splitAlongEdgeConstraints', 'true'),
+  ),
+  TriangulationOutput.RELIMIT_TO_POLYGON: (
+    ('singleSurface', 'false'),
+    ('singleSurfacePerObject', 'false'),
+    ('relimitToPolygon', 'true'),
+    ('splitAlongEdgeConstraints', 'false'),
+  ),
+}
+
+
 class MaskOperation(enum.Enum):
   """Specifies how an operation should act with existing data.
 
@@ -67,14 +102,34 @@ class MaskOperation(enum.Enum):
 
   def format_to_operation_string(self):
     """Format the value as expected by an operation input."""
-    if self is self.AND:
-      return 'And'
-    if self is self.OR:
-      return 'Or'
-    if self is self.REPLACE:
-      return 'Replace'
+    try:
+      return _MASK_OPERATION_STRINGS[self]
+    except KeyError:
+      raise ValueError('Unknown value %s' % self.value) from None
+
+
+_MASK_OPERATION_STRINGS = {
+  MaskOperation.AND: 'And',
+  MaskOperation.OR: 'Or',
+  MaskOperation.REPLACE: 'Replace',
+}
 
-    raise ValueError('Unknown value %s' % self.value)
+
+@functools.lru_cache(maxsize=64)
+def _format_colour(colour):
+  """Format a single colour for use as the value for a workflow input.
+
+  The result is cached because scripts typically contour many surfaces
+  with the same colours.
+
+  Parameters
+  ----------
+  colour : tuple
+    The colour to format. This must be a tuple so that it can be cached.
+
+  """
+  red, green, blue, alpha = convert_to_rgba(colour)
+  return f'({red},{green},{blue},{alpha})'
 
 
 def colour_by_distance_from_object(objects_to_colour,
@@ -112,12 +167,14 @@ def colour_by_distance_from_object(objects_to_colour,
   if not legend.is_a(NumericColourMap):
     raise TypeError('The legend must be a numeric colour map')
 
-  format_selection = RequestTransactionWithInputs.format_selection
+  # There are no objects to colour.
+  if not objects_to_colour:
+    return {'selection': [], 'mean_distance': None}
 
   inputs = [
-    ('selection', format_selection(objects_to_colour)),
+    ('selection', _format_selection(objects_to_colour)),
     # The typo of objects below is required and is expected by the transaction.
-    ('baseObects', format_selection(base_objects)),
+    ('baseObects', _format_selection(base_objects)),
     ('legend', repr(legend)),
     ('Closest object',
      measurement_target is DistanceMeasurementTarget.CLOSEST_OBJECT),
@@ -129,7 +186,7 @@ def colour_by_distance_from_object(objects_to_colour,
   outputs = request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_ColourDistanceFromSurfaceTransaction',
-    command_name='{0}.ColourByDistance'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.ColourByDistance',
     inputs=inputs,
     )
 
@@ -200,16 +257,15 @@ def contour_surface(surfaces, lower_limit, upper_limit,
     raise ValueError(f'The lower limit is greater ({lower_limit:.3f}) than '
                      f'the upper limit ({upper_limit:.3f})')
 
-  def _format_colour(colour):
-    """Format a single colour for use as the value for a workflow input."""
-    rgba_colour = convert_to_rgba(colour)
-    return '({},{},{},{})'.format(*rgba_colour)
+  # There are no surfaces to contour.
+  if not surfaces:
+    return []
 
   inputs = [
-    ('selection', RequestTransactionWithInputs.format_selection(surfaces)),
-    ('lowerLimit', '(0.0, 0.0, %f)' % lower_limit),
-    ('upperLimit', '(0.0, 0.0, %f)' % upper_limit),
-    ('majorColour', _format_colour(major_contour_colour)),
+    ('selection', _format_selection(surfaces)),
+    ('lowerLimit', f'(0.0, 0.0, {lower_limit:f})'),
+    ('upperLimit', f'(0.0, 0.0, {upper_limit:f})'),
+    ('majorColour', _format_colour(tuple(major_contour_colour))),
     ('majorInterval', str(major_contour_intervals)),
   ]
 
@@ -218,7 +274,7 @@ def contour_surface(surfaces, lower_limit, upper_limit,
       ('useMinorContours', 'true'),
       ('useMinorContours/minorInterval', str(minor_contour_intervals)),
       ('useMinorContours/minorColour',
-       _format_colour(minor_contour_colour)),
+       _format_colour(tuple(minor_contour_colour))),
     ])
 
   if destination_path:
@@ -227,7 +283,7 @@ def contour_surface(surfaces, lower_limit, upper_limit,
   outputs = request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_ContourFacetNetworkTransaction',
-    command_name='{0}.ContourSurface'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.ContourSurface',
     inputs=inputs,
     )
 
@@ -242,14 +298,18 @@ def fill_holes(surfaces):
     The list of surfaces to have holes filled in.
   """
 
+  # There are no surfaces to fill.
+  if not surfaces:
+    return
+
   inputs = [
-    ('selection', RequestTransactionWithInputs.format_selection(surfaces)),
+    ('selection', _format_selection(surfaces)),
   ]
 
   request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_FillHolesTransaction',
-    command_name='{0}.FillHoles'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.FillHoles',
     inputs=inputs,
     )
 
@@ -282,25 +342,40 @@ def filter_by_polygon(scans,
   ValueError
     If extrusion_direction is not a three dimensional vector.
   """
-  format_selection = RequestTransactionWithInputs.format_selection
-
-  if numpy.shape(extrusion_direction) != (3,):
-    raise ValueError('The extrusion direction must be a vector with a X, Y '
+  direction_error = ('The extrusion direction must be a vector with a X, Y '
                      'and Z component.')
+  try:
+    component_count = len(extrusion_direction)
+  except TypeError as error:
+    raise ValueError(direction_error) from error
+  if isinstance(extrusion_direction, str) or component_count != 3:
+    raise ValueError(direction_error)
+  if any(getattr(component, 'shape', ()) != ()
+         for component in extrusion_direction):
+    # Each component must be a scalar, e.g. reject an array of shape (3, 1).
+    raise ValueError(direction_error)
+  try:
+    x, y, z = (float(component) for component in extrusion_direction)
+  except (TypeError, ValueError) as error:
+    raise ValueError(direction_error) from error
+
+  # There are no scans to filter.
+  if not scans:
+    return
 
   inputs = [
-    ('selection', format_selection(scans)),
+    ('selection', _format_selection(scans)),
     ('polygon', repr(polygon)),
-    ('direction', '({}, {}, {})'.format(*extrusion_direction)),
-    ('Inside', 'true' if keep_points_inside else 'false'),
-    ('Outside', 'false' if keep_points_inside else 'true'),
+    ('direction', f'({x}, {y}, {z})'),
+    ('Inside', _BOOL_STR[bool(keep_points_inside)]),
+    ('Outside', _BOOL_STR[not keep_points_inside]),
     ('maskOperation', filter_combination.format_to_operation_string()),
   ]
 
   request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_MaskByPolygonTransaction',
-    command_name='{0}.FilterPolygon'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.FilterPolygon',
     inputs=inputs,
     )
 
@@ -324,10 +399,12 @@ def filter_isolated_points(scans,
     the selected data.
   """
 
-  format_selection = RequestTransactionWithInputs.format_selection
+  # There are no scans to filter.
+  if not scans:
+    return
 
   inputs = [
-    ('selection', format_selection(scans)),
+    ('selection', _format_selection(scans)),
     ('pointSeparation', str(point_separation)),
     ('maskOperation', filter_combination.format_to_operation_string()),
   ]
@@ -335,7 +412,7 @@ def filter_isolated_points(scans,
   request_transaction(
     server='sdpServer',
     transaction='::sdpS_MaskOutlierTransaction',
-    command_name='{0}.FilterIsolatedPoints'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.FilterIsolatedPoints',
     inputs=inputs,
     )
 
@@ -368,20 +445,22 @@ def filter_minimum_separation(scans,
     even distribution of data for the entire set of objects.
   """
 
-  format_selection = RequestTransactionWithInputs.format_selection
+  # There are no scans to filter.
+  if not scans:
+    return
 
   inputs = [
-    ('selection', format_selection(scans)),
+    ('selection', _format_selection(scans)),
     ('minimumDistance', str(minimum_distance)),
     ('maskOperation', filter_combination.format_to_operation_string()),
     ('Apply filter to selection as a whole',
-     'false' if treat_scans_separately else 'true'),
+     _BOOL_STR[not treat_scans_separately]),
   ]
 
   request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_MaskMinimumSeparationTransaction',
-    command_name='{0}.FilterMinimumSeparation'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.FilterMinimumSeparation',
     inputs=inputs,
     )
 
@@ -422,22 +501,24 @@ def filter_topography(scans,
     even distribution of data for the entire set of objects.
   """
 
-  format_selection = RequestTransactionWithInputs.format_selection
+  # There are no scans to filter.
+  if not scans:
+    return
 
   inputs = [
-    ('selection', format_selection(scans)),
+    ('selection', _format_selection(scans)),
     ('searchCellSize', str(search_cell_size)),
-    ('Lower points', 'true' if keep_lower_points else 'false'),
-    ('Upper points', 'false' if keep_lower_points else 'true'),
+    ('Lower points', _BOOL_STR[bool(keep_lower_points)]),
+    ('Upper points', _BOOL_STR[not keep_lower_points]),
     ('maskOperation', filter_combination.format_to_operation_string()),
     ('Apply filter to selection as a whole',
-     'false' if treat_scans_separately else 'true'),
+     _BOOL_STR[not treat_scans_separately]),
   ]
 
   request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_MaskHighLowTransaction',
-    command_name='{0}.FilterTopography'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.FilterTopography',
     inputs=inputs,
     )
 
@@ -472,8 +553,12 @@ def simplify_by_distance_error(surfaces,
     The list of surfaces.
   """
 
+  # There are no surfaces to simplify.
+  if not surfaces:
+    return []
+
   inputs = [
-    ('selection', RequestTransactionWithInputs.format_selection(surfaces)),
+    ('selection', _format_selection(surfaces)),
     ('distanceError', str(distance_error)),
     ('preserveBoundaryEdges', str(preserve_boundary_edges).lower()),
     ('avoidIntersections', str(avoid_intersections).lower()),
@@ -482,7 +567,7 @@ def simplify_by_distance_error(surfaces,
   outputs = request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_SimplifyFacetNetworkPanelTransaction',
-    command_name='{0}.SimplifyByDistanceError'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.SimplifyByDistanceError',
     requester_icon='SimplifyTriangulationError',
     inputs=inputs,
     )
@@ -523,8 +608,12 @@ def simplify_by_triangle_count(surfaces,
     The list of surfaces.
   """
 
+  # There are no surfaces to simplify.
+  if not surfaces:
+    return []
+
   inputs = [
-    ('selection', RequestTransactionWithInputs.format_selection(surfaces)),
+    ('selection', _format_selection(surfaces)),
     ('facetCount', str(triangle_count)),
     ('preserveBoundaryEdges', str(preserve_boundary_edges).lower()),
     ('avoidIntersections', str(avoid_intersections).lower()),
@@ -533,7 +622,7 @@ def simplify_by_triangle_count(surfaces,
   outputs = request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_SimplifyFacetNetworkPanelTransaction',
-    command_name='{0}.SimplifyByFacetCount'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.SimplifyByFacetCount',
     requester_icon='SimplifyTriangulationCount',
     inputs=inputs,
     )
@@ -567,13 +656,13 @@ def despike(surfaces):
     return []
 
   inputs = [
-    ('selection', RequestTransactionWithInputs.format_selection(surfaces)),
+    ('selection', _format_selection(surfaces)),
     ]
 
   outputs = request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_FacetNetworkDespikerTransaction',
-    command_name='{0}.Despike'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.Despike',
     inputs=inputs,
     )
 
@@ -608,8 +697,12 @@ def fix_surface(surfaces):
     The list of surfaces.
   """
 
+  # There are no surfaces to fix.
+  if not surfaces:
+    return []
+
   inputs = [
-    ('selection', RequestTransactionWithInputs.format_selection(surfaces)),
+    ('selection', _format_selection(surfaces)),
     ('isFixingSelfIntersections', 'true'),
     ('isFixingTrifurcations', 'true'),
     ('isFixingFacetNormals', 'true'),
@@ -619,7 +712,7 @@ def fix_surface(surfaces):
   outputs = request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_FixFacetNetworkTransaction',
-    command_name='{0}.FixSurface'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.FixSurface',
     inputs=inputs,
     )
 
@@ -681,10 +774,12 @@ def topographic_triangulation(
     raise ValueError('If providing the edges for edge constraints, the '
                      'output_option should be SPLIT_ALONG_EDGE_CONSTRAINTS')
 
+  # There is nothing to triangulate.
+  if not scans and not edge_constraints:
+    return
+
   inputs = [
-    ('selection',
-     RequestTransactionWithInputs.format_selection(
-       scans + (edge_constraints or []))),
+    ('selection', _format_selection(scans + (edge_constraints or []))),
   ]
 
   if destination:
@@ -699,40 +794,20 @@ def topographic_triangulation(
        str(trim_edges_to_maximum_length)),
     ])
 
-  if output_option is TriangulationOutput.SINGLE_SURFACE:
-    inputs.extend([
-      ('singleSurface', 'true'),
-      ('singleSurfacePerObject', 'false'),
-      ('relimitToPolygon', 'false'),
-      ('splitAlongEdgeConstraints', 'false'),
-    ])
-  elif output_option is TriangulationOutput.SURFACE_PER_OBJECT:
-    inputs.extend([
-      ('singleSurface', 'true'),
-      ('singleSurfacePerObject', 'false'),
-      ('relimitToPolygon', 'false'),
-      ('splitAlongEdgeConstraints', 'false'),
-    ])
-  elif output_option is TriangulationOutput.SPLIT_ALONG_EDGE_CONSTRAINTS:
-    inputs.extend([
-      ('singleSurface', 'false'),
-      ('singleSurfacePerObject', 'false'),
-      ('relimitToPolygon', 'false'),
-      ('splitAlongEdgeConstraints', 'true'),
-    ])
-  elif output_option is TriangulationOutput.RELIMIT_TO_POLYGON:
-    inputs.extend([
-      ('singleSurface', 'false'),
-      ('singleSurfacePerObject', 'false'),
-      ('relimitToPolygon', 'true'),
-      ('splitAlongEdgeConstraints', 'false'),
-      ('relimitToPolygon/relimitPolygon', repr(relimit_to_polygon)),
-    ])
+  try:
+    inputs.extend(_TRIANGULATION_OUTPUT_INPUTS[output_option])
+  except KeyError:
+    raise ValueError(
+      f'Unknown triangulation output option: {output_option}') from None
+
+  if output_option is TriangulationOutput.RELIMIT_TO_POLYGON:
+    inputs.append(
+      ('relimitToPolygon/relimitPolygon', repr(relimit_to_polygon)))
 
   request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_Triangulation2DTransaction',
-    command_name='{0}.TopographicTriangulation'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.TopographicTriangulation',
     inputs=inputs,
     )
 
@@ -758,8 +833,12 @@ def loop_surface_straight(selection, destination=None):
     Selection containing the created Surface.
 
   """
+  # There are no loops to triangulate.
+  if not selection:
+    return []
+
   inputs = [
-    ('selection', RequestTransactionWithInputs.format_selection(selection)),
+    ('selection', _format_selection(selection)),
     ('straightLoopOrdering', 'true'),
     ('iterativeLoopOrdering', 'false'),
   ]
@@ -770,7 +849,7 @@ def loop_surface_straight(selection, destination=None):
   outputs = request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_TriangulateLoopSetTransaction',
-    command_name='{0}.TriangulateLoopSet'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.TriangulateLoopSet',
     inputs=inputs,
     )
 
@@ -801,8 +880,12 @@ def loop_surface_iterative(selection, destination=None):
     Selection containing the created Surface(s).
 
   """
+  # There are no loops to triangulate.
+  if not selection:
+    return []
+
   inputs = [
-    ('selection', RequestTransactionWithInputs.format_selection(selection)),
+    ('selection', _format_selection(selection)),
     ('straightLoopOrdering', 'false'),
     ('iterativeLoopOrdering', 'true'),
   ]
@@ -813,7 +896,7 @@ def loop_surface_iterative(selection, destination=None):
   outputs = request_transaction(
     server='sdpServer',
     transaction='mtp::sdpS_TriangulateLoopSetTransaction',
-    command_name='{0}.TriangulateLoopSet'.format(COMMAND_PREFIX),
+    command_name=f'{COMMAND_PREFIX}.TriangulateLoopSet',
     inputs=inputs,
     )
 
@@ -17,13 +17,22 @@ hiding/showing objects and querying what objects are in the view.
 #
 ###############################################################################
 
+import contextlib
 import ctypes
+import enum
+import threading
 import typing
 
 from mapteksdk.capi.viewer import Viewer, ViewerErrorCodes
 from mapteksdk.data import ObjectID
 from mapteksdk.internal.comms import Message, Request
 
+# The buffer which the server name of a view is read into. Each thread
+# creates its buffer the first time it creates a view controller and then
+# reuses it.
+_SERVER_NAME_BUFFER = threading.local()
+_SERVER_NAME_MAXIMUM_LENGTH = 256
+
 
 class ViewNoLongerExists(RuntimeError):
   """Exception for when a view is expected but it no longer exists.
@@ -33,9 +42,12 @@ class ViewNoLongerExists(RuntimeError):
   """
 
 
-class ObjectFilter:
+class ObjectFilter(enum.IntFlag):
   """Describes different ways to filter what objects are returned by
-  a ViewController."""
+  a ViewController.
+
+  The filters may be combined with the | operator.
+  """
 
   DEFAULT = 0
   """Default - return all object except transient and background objects but
@@ -55,6 +67,111 @@ class ObjectFilter:
   """Only return objects that are selected and are in the view."""
 
 
+# The messages below are defined once here rather than within the methods of
+# ViewController that send them, as defining a message class requires its
+# fields to be parsed.
+
+
+class _WindowTitle(Request):
+  """Defines message for querying what window title of a view."""
+
+  class Response(Message):
+    """The response containing the window title."""
+    title: str
+
+  message_name: typing.ClassVar[str] = 'WindowTitle'
+  response_type = Response
+
+  view_name: str
+
+
+class _DestroyView(Message):
+  """This message destroys (closes) the view."""
+  message_name: typing.ClassVar[str] = 'DestroyView'
+
+
+class _ObjectsInView(Request):
+  """Defines message for querying what objects are in a view."""
+  class Response(Message):
+    """The response back with what objects are in a view."""
+    objects: typing.List[ObjectID]
+
+  message_name: typing.ClassVar[str] = 'ObjectsInView'
+  response_type = Response
+
+  object_filter: ctypes.c_uint32  # ObjectFilter
+  type_filter: typing.List[ctypes.c_uint16]
+
+
+class _AddObjects(Message):
+  """Message for the viewer for adding objects to it."""
+  message_name: typing.ClassVar[str] = 'AddObjects'
+
+  objects: typing.List[ObjectID]
+  drop_point: (ctypes.c_double, ctypes.c_double) = (
+    float('NaN'), float('NaN'))
+
+
+class _RemoveObjects(Message):
+  """Message for the viewer for removing objects from it."""
+  message_name: typing.ClassVar[str] = 'RemoveObjects'
+
+  objects: typing.List[ObjectID]
+
+
+class _HideObjects(Message):
+  """Message for the viewer for hiding objects."""
+  message_name: typing.ClassVar[str] = 'HideObjects'
+
+  objects: typing.List[ObjectID]
+  mouse: (ctypes.c_double, ctypes.c_double) = (
+    float('NaN'), float('NaN'))
+
+
+class _HideObjectsV0(Message):
+  """Message for the viewer for hiding objects.
+
+  This is for versions of the viewer before 1.1 which did not accept the
+  mouse position.
+  """
+  message_name: typing.ClassVar[str] = 'HideObjects'
+
+  objects: typing.List[ObjectID]
+
+
+class _ShowObjects(Message):
+  """Message for the viewer for showing objects."""
+  message_name: typing.ClassVar[str] = 'ShowObjects'
+
+  objects: typing.List[ObjectID]
+
+
+class _RequestBackgroundColour(Request):
+  """Query background colour of a view window."""
+  class Response(Message):
+    colour: ctypes.c_uint32
+
+  message_name: typing.ClassVar[str] = 'BackgroundColour'
+  response_type: typing.ClassVar[type] = Response
+
+
+class _SetBackgroundColour(Message):
+  """Sets the background colour of a view window."""
+  message_name: typing.ClassVar[str] = 'SetBackgroundColour'
+
+  colour: ctypes.c_uint32
+
+
+class _StartTransition(Message):
+  """Tells the viewer that it will be transitioning the camera to a new
+  location.
+  """
+  message_name: typing.ClassVar[str] = 'StartTransition'
+
+  axes_transition_mode: ctypes.c_int32 = 2
+  transition_time: ctypes.c_double
+
+
 class ViewController:
   """Provides access onto a specified view.
 
@@ -64,18 +181,32 @@ class ViewController:
     # In PointStudio 2020.1, there are no safe-guards in place to confirm that
     # the given view_id is infact an ID for a view and it exists. This will
     # simply crash.
-    maximum_length = 256
-    server_name = ctypes.create_string_buffer(maximum_length)
-    Viewer().GetServerName(
-      view_id.native_handle, server_name, maximum_length)
+    viewer = Viewer()
+    server_name = getattr(_SERVER_NAME_BUFFER, 'buffer', None)
+    if server_name is None:
+      server_name = ctypes.create_string_buffer(_SERVER_NAME_MAXIMUM_LENGTH)
+      _SERVER_NAME_BUFFER.buffer = server_name
+    else:
+      # Clear the name left by the previous view so a failure is detected.
+      server_name[0] = b'\0'
+    viewer.GetServerName(
+      view_id.native_handle, server_name, _SERVER_NAME_MAXIMUM_LENGTH)
     if not server_name.value:
-      error_message = Viewer().ErrorMessage()
-      if Viewer().ErrorCode() == ViewerErrorCodes.VIEW_NO_LONGER_EXISTS:
+      error_message = viewer.ErrorMessage()
+      if viewer.ErrorCode() == ViewerErrorCodes.VIEW_NO_LONGER_EXISTS:
         raise ViewNoLongerExists(error_message)
       raise ValueError(error_message)
 
     self.server_name = server_name.value.decode('utf-8')
 
+    # The version of the viewer library can't change while the script is
+    # running so it is only queried once rather than for each message that
+    # depends on it.
+    self._viewer_version = viewer.version
+
+    # The messages queued by batch(), or None if there is no batch.
+    self._pending_messages = None
+
     # Like the DataObject class provide the ability to query the ID of the
     # view controller.
     self.id = view_id
@@ -87,19 +218,7 @@ class ViewController:
   def window_title(self):
     """Return the window title (the name of the view) as seen in the application."""
 
-    class WindowTitle(Request):
-      """Defines message for querying what window title of a view."""
-
-      class Response(Message):
-        """The response containing the window title."""
-        title: str
-
-      message_name: typing.ClassVar[str] = 'WindowTitle'
-      response_type = Response
-
-      view_name: str
-
-    request = WindowTitle()
+    request = _WindowTitle()
     request.view_name = self.server_name
 
     # The viewer server doesn't know its title as its the uiServer that
@@ -130,11 +249,7 @@ class ViewController:
     >>> input('Press enter to finish')
     >>> view.close()
     """
-    class DestroyView(Message):
-      """This message destroys (closes) the view."""
-      message_name: typing.ClassVar[str] = 'DestroyView'
-
-    DestroyView().send(destination=self.server_name)
+    _DestroyView().send(destination=self.server_name)
 
   def objects_in_view(self, object_filter=ObjectFilter.DEFAULT):
     """Return a list of objects that are in the the view.
@@ -142,7 +257,9 @@ class ViewController:
     Parameters
     ----------
     object_filter : ObjectFilter
-      A filter that limits what objects are returned.
+      A filter that limits what objects are returned. Multiple filters can be
+      combined, for example ObjectFilter.VISIBLE_ONLY |
+      ObjectFilter.SELECTED_ONLY.
 
     Returns
     -------
@@ -160,25 +277,93 @@ class ViewController:
     # However receiving a message containing it would be problemantic as its
     # not easy to map it back.
 
-    class ObjectsInView(Request):
-      """Defines message for querying what objects are in a view."""
-      class Response(Message):
-        """The response back with what objects are in a view."""
-        objects: typing.List[ObjectID]
-
-      message_name: typing.ClassVar[str] = 'ObjectsInView'
-      response_type = Response
-
-      object_filter: ctypes.c_uint32  # ObjectFilter
-      type_filter: typing.List[ctypes.c_uint16]
-
-    request = ObjectsInView()
-    request.object_filter = object_filter
+    request = _ObjectsInView()
+    request.object_filter = int(object_filter)
     request.type_filter = []
 
     response = request.send(destination=self.server_name)
     return response.objects
 
+  @contextlib.contextmanager
+  def batch(self):
+    """Batch changes to the objects in the view.
+
+    Within the batch, add_objects(), remove_objects(), hide_objects() and
+    show_objects() are queued rather than sent to the view immediately.
+    Consecutive calls of the same kind are combined into a single message,
+    and the messages are sent in order when the batch ends. This reduces the
+    number of messages sent when changing many objects one at a time.
+
+    Batches may be nested, in which case the messages are sent when the
+    outermost batch ends.
+
+    Warnings
+    --------
+    Changes made within the batch are not reflected by objects_in_view()
+    until the batch has ended.
+
+    Examples
+    --------
+    Add each surface in a container to the view and hide it, sending only
+    two messages to the view.
+
+    >>> from mapteksdk.project import Project
+    >>> import mapteksdk.operations as operations
+    >>> project = Project()
+    >>> view = operations.open_new_view()
+    >>> with view.batch():
+    ...     for _, surface in project.get_children('/surfaces').items():
+    ...         view.add_objects([surface])
+    ...     for _, surface in project.get_children('/surfaces').items():
+    ...         view.hide_objects([surface])
+    """
+    if self._pending_messages is not None:
+      # This is a nested batch, so the outer batch will send the messages.
+      yield self
+      return
+
+    self._pending_messages = []
+    try:
+      yield self
+    finally:
+      pending_messages = self._pending_messages
+      self._pending_messages = None
+      for message_type, objects in pending_messages:
+        request = message_type()
+        request.objects = objects
+        request.send(destination=self.server_name)
+
+  def _send_objects(self, message_type, objects):
+    """Send a message which operates on objects to the view.
+
+    Nothing is sent if there are no objects, as the message would have no
+    effect on the view.
+
+    If there is a batch then the message is queued instead. It is combined
+    with the last queued message if that is of the same type.
+
+    Parameters
+    ----------
+    message_type : type
+      The type of message to send. It must have an objects field.
+    objects : list
+      A list of IDs of objects to include in the message.
+    """
+    if not objects:
+      return
+
+    pending_messages = self._pending_messages
+    if pending_messages is not None:
+      if pending_messages and pending_messages[-1][0] is message_type:
+        pending_messages[-1][1].extend(objects)
+      else:
+        pending_messages.append((message_type, list(objects)))
+      return
+
+    request = message_type()
+    request.objects = objects
+    request.send(destination=self.server_name)
+
   def add_objects(self, objects):
     """Adds the provided objects to the view.
 
@@ -188,17 +373,7 @@ class ViewController:
       A list of IDs of objects to add to the view.
     """
 
-    class AddObjects(Message):
-      """Message for the viewer for adding objects to it."""
-      message_name: typing.ClassVar[str] = 'AddObjects'
-
-      objects: typing.List[ObjectID]
-      drop_point: (ctypes.c_double, ctypes.c_double) = (
-        float('NaN'), float('NaN'))
-
-    request = AddObjects()
-    request.objects = objects
-    request.send(destination=self.server_name)
+    self._send_objects(_AddObjects, objects)
 
   def remove_objects(self, objects):
     """Removes the provided objects from the view if present.
@@ -211,15 +386,7 @@ class ViewController:
       A list of IDs of objects to remove from the view.
     """
 
-    class RemoveObjects(Message):
-      """Message for the viewer for removing objects from it."""
-      message_name: typing.ClassVar[str] = 'RemoveObjects'
-
-      objects: typing.List[ObjectID]
-
-    request = RemoveObjects()
-    request.objects = objects
-    request.send(destination=self.server_name)
+    self._send_objects(_RemoveObjects, objects)
 
   def hide_objects(self, objects):
     """Hide the provided objects in the view.
@@ -232,24 +399,10 @@ class ViewController:
       A list of IDs of objects to hide.
     """
 
-    if Viewer().version >= (1, 1):
-      class HideObjects(Message):
-        """Message for the viewer for hiding objects."""
-        message_name: typing.ClassVar[str] = 'HideObjects'
-
-        objects: typing.List[ObjectID]
-        mouse: (ctypes.c_double, ctypes.c_double) = (
-          float('NaN'), float('NaN'))
+    if self._viewer_version >= (1, 1):
+      self._send_objects(_HideObjects, objects)
     else:
-      class HideObjects(Message):
-        """Message for the viewer for hiding objects."""
-        message_name: typing.ClassVar[str] = 'HideObjects'
-
-        objects: typing.List[ObjectID]
-
-    request = HideObjects()
-    request.objects = objects
-    request.send(destination=self.server_name)
+      self._send_objects(_HideObjectsV0, objects)
 
   def show_objects(self, objects):
     """Show the provided objects in the view (if hidden).
@@ -262,15 +415,7 @@ class ViewController:
       A list of IDs of objects to hide.
     """
 
-    class ShowObjects(Message):
-      """Message for the viewer for showing objects."""
-      message_name: typing.ClassVar[str] = 'ShowObjects'
-
-      objects: typing.List[ObjectID]
-
-    request = ShowObjects()
-    request.objects = objects
-    request.send(destination=self.server_name)
+    self._send_objects(_ShowObjects, objects)
 
   @property
   def background_colour(self):
@@ -282,23 +427,11 @@ class ViewController:
     the colour may be given as either a tuple, list or ndarray.
     """
 
-    class RequestBackgroundColour(Request):
-      """Query background colour of a view window."""
-      class Response(Message):
-        colour: ctypes.c_uint32
-
-      message_name: typing.ClassVar[str] = 'BackgroundColour'
-      response_type: typing.ClassVar[type] = Response
-
-    request = RequestBackgroundColour()
+    request = _RequestBackgroundColour()
     response = request.send(destination=self.server_name)
 
-    alpha = (response.colour >> 24) & 0xFF
-    blue = (response.colour >> 16) & 0xFF
-    green = (response.colour >> 8) & 0xFF
-    red = response.colour & 0xFF
-
-    return (red, green, blue, alpha)
+    # The colour is encoded as a 32-bit integer with red in the lowest byte.
+    return tuple(response.colour.to_bytes(4, 'little'))
 
   @background_colour.setter
   def background_colour(self, new_colour):
@@ -310,12 +443,6 @@ class ViewController:
     # which reduces specific colours used in the background as the time of day
     # changes.
 
-    class SetBackgroundColour(Message):
-      """Sets the background colour of a view window."""
-      message_name: typing.ClassVar[str] = 'SetBackgroundColour'
-
-      colour: ctypes.c_uint32
-
     red, green, blue = new_colour[:3]
     if len(new_colour) == 4:
       alpha = new_colour[3]
@@ -324,9 +451,9 @@ class ViewController:
 
     # Colour encoded as a 32-bit integer. This more than likely needs
     # to be packaged up as part of the comms module.
-    colour = (alpha << 24) | (blue << 16) | (green << 8) | (red << 0)
+    colour = int.from_bytes(bytes((red, green, blue, alpha)), 'little')
 
-    message = SetBackgroundColour()
+    message = _SetBackgroundColour()
     message.colour = colour
     message.send(destination=self.server_name)
 
@@ -336,15 +463,6 @@ class ViewController:
     transition_time : float
       The time the transition should last in seconds.
     """
-    class StartTransition(Message):
-      """Tells the viewer that it will be transitioning the camera to a new
-      location.
-      """
-      message_name: typing.ClassVar[str] = 'StartTransition'
-
-      axes_transition_mode: ctypes.c_int32 = 2
-      transition_time: ctypes.c_double
-
-    message = StartTransition()
+    message = _StartTransition()
     message.transition_time = transition_time
     message.send(destination=self.server_name)
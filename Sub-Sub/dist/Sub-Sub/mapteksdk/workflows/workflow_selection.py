@@ -13,6 +13,74 @@ from ..data.base import DataObject
 from ..internal.util import default_type_error_message
 from ..workflows.connector_type import ConnectorType
 
+# Converts each type of item which can be in a selection to the string used
+# for it in the JSON representation of the selection.
+_TO_JSON = {
+  str: lambda item: item,
+  ObjectID: lambda item: str(item.path),
+  DataObject: lambda item: str(item.id.path),
+}
+
+
+def _split_selection(selection_string):
+  """Split a selection string into its comma separated items.
+
+  This gives the same result as csv.reader() with skipinitialspace=True,
+  except that an empty string is an empty selection and an unquoted Object ID
+  is kept as a single item rather than being split on its commas.
+
+  Parameters
+  ----------
+  selection_string : str
+    String representing the selection.
+
+  Returns
+  -------
+  list of str
+    The items in the selection.
+
+  Raises
+  ------
+  RuntimeError
+    If an unquoted Object ID is missing its closing bracket.
+
+  """
+  if not selection_string:
+    return []
+
+  # Most selections contain no quoted items or line terminators, in which case
+  # splitting on the commas is all that is needed. csv.reader() treats both of
+  # those specially, so leave such selections to it.
+  if '"' in selection_string or "\n" in selection_string or (
+      "\r" in selection_string):
+    items = next(csv.reader([selection_string], skipinitialspace=True))
+  else:
+    items = selection_string.split(",")
+
+  selection = []
+  items = iter(items)
+  for item in items:
+    item = item.lstrip(" ")
+    # If we have an OID without its closing bracket, then it was probably
+    # unquoted and was split on commas. So fuse the parts together.
+    # Also check for orphans which will need the same treatment for
+    # orphan paths as they contain the OID.
+    # :TODO: Jayden Boskell 04-06-2021 SDK-507 Escape the commas on
+    # the workflows side. This code may still need to be kept for
+    # backwards compatability.
+    if item.startswith(("OID", "\\orphan")) and ")" not in item:
+      parts = [item]
+      for part in items:
+        parts.append(part.lstrip(" "))
+        if ")" in part:
+          break
+      else:
+        # This is not expected to happen.
+        raise RuntimeError(f"Failed to parse partial Object ID: {item}")
+      item = ", ".join(parts)
+    selection.append(item)
+  return selection
+
 class WorkflowSelection(ConnectorType):
   """Class representing a read-only list of ObjectIDs. Pass this to
   declare_input_connector for input connectors expecting a selection -
@@ -91,30 +159,7 @@ class WorkflowSelection(ConnectorType):
       raise TypeError(default_type_error_message("workflow selection",
                                                  selection_string,
                                                  str))
-    self.selection = list(csv.reader([selection_string],
-                                     skipinitialspace=True))[0]
-    for i, item in enumerate(self.selection):
-      # If we have an OID without a comma, then it was probably
-      # unquoted and was split on commas. So fuse the three parts
-      # together.
-      # Also check for orphans which will need the same treatment for
-      # orphan paths as they contain the OID.
-      if item.startswith(("OID", "\\orphan")) and "," not in item:
-        try:
-          # :TODO: Jayden Boskell 04-06-2021 SDK-507 Escape the commas on
-          # the workflows side. This code may still need to be kept for
-          # backwards compatability.
-          if ")" in self.selection[i + 1]:
-            self.selection[i:i+2] = [", ".join([self.selection[i],
-                                                self.selection[i + 1]])]
-          else:
-            self.selection[i:i+3] = [", ".join([self.selection[i],
-                                                self.selection[i + 1],
-                                                self.selection[i + 2]])]
-        except IndexError as error:
-          # This is not expected to happen.
-          raise RuntimeError("Failed to parse partial Object ID: "
-                             f"{item}") from error
+    self.selection = _split_selection(selection_string)
     self.selection_ids = None
 
   @classmethod
@@ -135,15 +180,15 @@ class WorkflowSelection(ConnectorType):
       value = [value]
     results = []
     for item in value:
-      if isinstance(item, str):
-        results.append(item)
-      elif isinstance(item, ObjectID):
-        results.append(str(item.path))
-      elif isinstance(item, DataObject):
-        results.append(str(item.id.path))
+      # Subclasses are handled the same as their nearest base class.
+      for item_type in type(item).__mro__:
+        convert = _TO_JSON.get(item_type)
+        if convert is not None:
+          break
       else:
         raise TypeError(default_type_error_message("selection", item,
                                                    "selection"))
+      results.append(convert(item))
     return results
 
   @property
@@ -152,6 +197,9 @@ class WorkflowSelection(ConnectorType):
     This must be called after Project() has been called. Object IDs only have
     meaning within a Project.
 
+    The IDs are only resolved the first time they are needed, subsequent
+    calls return a copy of the same list.
+
     Returns
     -------
     list of ObjectID
@@ -165,30 +213,38 @@ class WorkflowSelection(ConnectorType):
       If called before Project() is called.
 
     """
-    result = []
-    for item in self.selection:
-      if item.startswith("'") and item.endswith("'"):
-        item = item[1:-1]
-      try:
-        # pylint: disable=protected-access;reason="No other way to convert."
-        result.append(ObjectID._from_string(item))
-      except ValueError:
-        result.append(ObjectID.from_path(item))
-    return result
-    # The ObjectID constructor needs the DLLs so will fail with an OSError
-    # if they aren't loaded.
+    return list(self._resolved_ids())
 
-  def __getitem__(self, key):
+  def _resolved_ids(self):
+    """Return the cached list of IDs in the selection, resolving them if
+    this is the first time they are needed.
+
+    The returned list should not be modified.
+
+    """
     if self.selection_ids is None:
-      self.selection_ids = self.ids
-    return self.selection_ids[key]
+      # pylint: disable=protected-access;reason="No other way to convert."
+      from_string = ObjectID._from_string
+      from_path = ObjectID.from_path
+      result = []
+      append = result.append
+      for item in self.selection:
+        if item.startswith("'") and item.endswith("'"):
+          item = item[1:-1]
+        # The ObjectID constructor needs the DLLs so will fail with an OSError
+        # if they aren't loaded.
+        try:
+          append(from_string(item))
+        except ValueError:
+          append(from_path(item))
+      self.selection_ids = result
+    return self.selection_ids
+
+  def __getitem__(self, key):
+    return self._resolved_ids()[key]
 
   def __len__(self):
-    if self.selection_ids is None:
-      self.selection_ids = self.ids
-    return len(self.selection_ids)
+    return len(self._resolved_ids())
 
   def __iter__(self):
-    if self.selection_ids is None:
-      self.selection_ids = self.ids
-    return iter(self.selection_ids)
+    return iter(self._resolved_ids())
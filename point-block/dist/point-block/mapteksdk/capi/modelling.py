@@ -22,7 +22,8 @@ import numpy as np
 from .types import (T_ReadHandle, T_ObjectHandle, T_TypeIndex,
                     T_MessageHandle)
 from .util import (singleton, declare_dll_functions, raise_if_version_too_old,
-                   CApiUnknownError, CApiDllLoadFailureError)
+                   CApiUnknownError, CApiDllLoadFailureError,
+                   LazilyDeclaredDll)
 from .dataengine import DataEngine
 from .wrapper_base import WrapperBase
 
@@ -34,7 +35,7 @@ class Modelling(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_modelling
+      self.dll = LazilyDeclaredDll("mdf_modelling")
       self.log.debug("Loaded: mdf_modelling.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_modelling.dll")
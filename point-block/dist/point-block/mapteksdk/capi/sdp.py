@@ -17,9 +17,12 @@ this module. The contents may change at any time without warning.
 import ctypes
 import logging
 
+import numpy as np
+
 from .types import T_ReadHandle
 from .util import (singleton, declare_dll_functions, raise_if_version_too_old,
-                   CApiUnknownError, CApiDllLoadFailureError)
+                   CApiUnknownError, CApiDllLoadFailureError,
+                   LazilyDeclaredDll)
 
 from .wrapper_base import WrapperBase
 
@@ -31,7 +34,7 @@ class Sdp(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_sdp
+      self.dll = LazilyDeclaredDll("mdf_sdp")
       self.log.debug("Loaded: mdf_sdp.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_sdp.dll")
@@ -60,7 +63,7 @@ class Sdp(WrapperBase):
       # Functions changed in version 1.
       {"SdpCApiVersion" : (ctypes.c_uint32, None),
        "SdpCApiMinorVersion" : (ctypes.c_uint32, None),
-       "SdpRasterSetControlMultiPoint" : (ctypes.c_uint8, [ctypes.POINTER(T_ReadHandle), ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32, ]),
+       "SdpRasterSetControlMultiPoint" : (ctypes.c_uint8, [ctypes.POINTER(T_ReadHandle), ctypes.POINTER(ctypes.c_double), ctypes.POINTER(ctypes.c_double), ctypes.c_uint32, ]),
       }
     ]
 
@@ -108,15 +111,20 @@ class Sdp(WrapperBase):
       raise ValueError("Multi point association requires at least eight points, "
                        f"given: {point_count}")
 
-    c_image_points = (ctypes.c_double * (point_count * 2))()
-    c_image_points[:] = image_points.astype(ctypes.c_double, copy=False).ravel()
-    c_world_points = (ctypes.c_double * (point_count * 3))()
-    c_world_points[:] = world_points.astype(ctypes.c_double, copy=False).ravel()
-
-    result = self.dll.SdpRasterSetControlMultiPoint(lock,
-                                                    c_image_points,
-                                                    c_world_points,
-                                                    point_count)
+    # The points are passed to the C API directly from contiguous arrays.
+    # These only copy the points if they are not already doubles in a
+    # contiguous array.
+    c_image_points = np.ascontiguousarray(image_points[:point_count],
+                                          dtype=ctypes.c_double)
+    c_world_points = np.ascontiguousarray(world_points[:point_count],
+                                          dtype=ctypes.c_double)
+    double_pointer = ctypes.POINTER(ctypes.c_double)
+
+    result = self.dll.SdpRasterSetControlMultiPoint(
+      lock,
+      c_image_points.ctypes.data_as(double_pointer),
+      c_world_points.ctypes.data_as(double_pointer),
+      point_count)
 
     if result == 3:
       raise ValueError("Failed to associate raster: Positioning error")
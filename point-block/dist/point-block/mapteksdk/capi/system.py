@@ -15,7 +15,8 @@ this module. The contents may change at any time without warning.
 # pylint: disable=line-too-long
 import ctypes
 import logging
-from .util import singleton, declare_dll_functions, CApiDllLoadFailureError
+from .util import (singleton, declare_dll_functions, LazilyDeclaredDll,
+                   CApiDllLoadFailureError)
 from .wrapper_base import WrapperBase
 
 @singleton
@@ -26,7 +27,7 @@ class System(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_system
+      self.dll = LazilyDeclaredDll("mdf_system")
       self.log.debug("Loaded: mdf_system.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_system.dll")
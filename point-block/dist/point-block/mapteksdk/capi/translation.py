@@ -17,7 +17,7 @@ import ctypes
 import logging
 from .types import T_TextHandle, T_ContextHandle
 from .util import (singleton, declare_dll_functions, CApiDllLoadFailureError,
-                   raise_if_version_too_old, get_string)
+                   raise_if_version_too_old, get_string, LazilyDeclaredDll)
 from .wrapper_base import WrapperBase
 
 @singleton
@@ -28,7 +28,7 @@ class Translation(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_translation
+      self.dll = LazilyDeclaredDll("mdf_translation")
       self.log.debug("Loaded: mdf_translation.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_translation.dll")
@@ -17,7 +17,8 @@ import ctypes
 import enum
 import logging
 from .types import T_ObjectHandle
-from .util import singleton, declare_dll_functions, CApiDllLoadFailureError
+from .util import (singleton, declare_dll_functions, LazilyDeclaredDll,
+                   CApiDllLoadFailureError)
 from .wrapper_base import WrapperBase
 
 
@@ -48,7 +49,7 @@ class Viewer(WrapperBase):
     self.dll = None
 
     try:
-      self.dll = ctypes.cdll.mdf_viewer
+      self.dll = LazilyDeclaredDll("mdf_viewer")
       self.log.debug("Loaded: mdf_viewer.dll")
     except OSError as os_error:
       self.log.critical("Fatal: Cannot load mdf_viewer.dll")
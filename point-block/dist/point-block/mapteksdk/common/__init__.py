@@ -358,24 +358,28 @@ def convert_array_to_rgba(colour_array, expected_size, default_colour=None):
       "colours must be specified in the same format (Greyscale, RGB or RGBA."
       f"Actual shape: {colour_array.shape}.")
 
-  if colour_array.shape[1] == 1:
-    # Handling for greyscale colours.
-    alpha = np.full((colour_array.shape[0], 1), 255, dtype=ctypes.c_uint8)
-    colour_array = np.column_stack((colour_array, colour_array,
-                                    colour_array, alpha))
-  elif colour_array.shape[1] == 3:
-    # Handling for RGB colours.
-    alpha = np.full((colour_array.shape[0], 1), 255, dtype=ctypes.c_uint8)
-    colour_array = np.hstack((colour_array, alpha))
-  elif colour_array.shape[1] != 4:
+  row_count, component_count = colour_array.shape
+  if component_count not in (1, 3, 4):
     raise ValueError("Unable to convert colours to RGBA. Colours must have "
                      "one, three or four components (Greyscale, RGB or RGBA)."
-                     f"Actual components: {colour_array.shape[1]}.")
+                     f"Actual components: {component_count}.")
+
+  if component_count == 4 and row_count >= expected_size:
+    return colour_array
+
+  # Write the converted colours and the padding directly into the result
+  # rather than stacking the alpha and padding onto copies of the input.
+  rgba_array = np.empty((max(row_count, expected_size), 4),
+                        dtype=ctypes.c_uint8)
+  if component_count == 4:
+    rgba_array[:row_count] = colour_array
+  else:
+    # Greyscale colours are broadcast across the red, green and blue
+    # components.
+    rgba_array[:row_count, :3] = colour_array
+    rgba_array[:row_count, 3] = 255
 
   # Pad the colours with default if there is not enough.
-  if colour_array.shape[0] < expected_size:
-    new_row_count = expected_size - colour_array.shape[0]
-    extras = np.repeat(default_colour[np.newaxis, :], new_row_count, 0)
-    colour_array = np.vstack((colour_array, extras))
+  rgba_array[row_count:] = default_colour
 
-  return colour_array
+  return rgba_array
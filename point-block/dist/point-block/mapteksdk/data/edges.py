@@ -29,6 +29,73 @@ from .primitives import PointProperties, EdgeProperties
 # pylint: disable=too-many-instance-attributes
 log = logging.getLogger("mapteksdk.data")
 
+# The implicit edge arrays are read-only, so the arrays for small point
+# counts (which are the majority of cad polylines and polygons) are built
+# once and shared between all objects with that many points. Each object is
+# given a read-only view of the shared array. Unlike the shared array itself,
+# the view can't be made writeable again.
+_SHARED_EDGES_MAX_POINTS = 64
+_shared_polyline_edges = {}
+_shared_polygon_edges = {}
+
+def _polyline_edges(point_count):
+  """Returns the read-only edge array implied by a polyline.
+
+  Edge i is [i, i + 1]. Both columns are written directly into a single
+  preallocated buffer instead of repeating and slicing an index array.
+
+  Parameters
+  ----------
+  point_count : int
+    The number of points in the polyline.
+
+  Returns
+  -------
+  ndarray
+    Read-only array of shape (max(point_count - 1, 0), 2).
+
+  """
+  shared_edges = _shared_polyline_edges.get(point_count)
+  if shared_edges is not None:
+    return shared_edges.view()
+  edges = np.empty((max(point_count - 1, 0), 2), dtype=ctypes.c_uint32)
+  edges[:, 0] = np.arange(edges.shape[0], dtype=ctypes.c_uint32)
+  np.add(edges[:, 0], 1, out=edges[:, 1])
+  edges.flags.writeable = False
+  if point_count <= _SHARED_EDGES_MAX_POINTS:
+    _shared_polyline_edges[point_count] = edges
+    return edges.view()
+  return edges
+
+def _polygon_edges(point_count):
+  """Returns the read-only edge array implied by a polygon.
+
+  Edge i is [i, i + 1] except for the final edge which is [n - 1, 0].
+
+  Parameters
+  ----------
+  point_count : int
+    The number of points in the polygon.
+
+  Returns
+  -------
+  ndarray
+    Read-only array of shape (point_count, 2).
+
+  """
+  shared_edges = _shared_polygon_edges.get(point_count)
+  if shared_edges is not None:
+    return shared_edges.view()
+  edges = np.empty((point_count, 2), dtype=ctypes.c_uint32)
+  edges[:, 0] = np.arange(point_count, dtype=ctypes.c_uint32)
+  edges[:-1, 1] = edges[1:, 0]
+  edges[-1:, 1] = 0
+  edges.flags.writeable = False
+  if point_count <= _SHARED_EDGES_MAX_POINTS:
+    _shared_polygon_edges[point_count] = edges
+    return edges.view()
+  return edges
+
 class Edge(EdgeProperties, PointProperties, Topology):
   """Base class for EdgeNetwork, Polygon and Polyline.
 
@@ -120,8 +187,10 @@ class EdgeNetwork(Edge):
       True if successful.
 
     """
-    if isinstance(edge_indices, int):
-      remove_request = self._remove_edge(edge_indices)
+    # Use ndim rather than isinstance(int) so that numpy integer scalars
+    # (e.g. an element of an index array) take the single edge path.
+    if np.ndim(edge_indices) == 0:
+      remove_request = self._remove_edge(int(edge_indices))
     else:
       remove_request = self._remove_edges(edge_indices)
     if remove_request and update_immediately:
@@ -190,10 +259,22 @@ class Polyline(Edge):
 
   @property
   def edges(self):
-    edges = np.arange(self.point_count, dtype=ctypes.c_uint32)
-    edges = np.repeat(edges, 2)
-    edges.flags.writeable = False
-    return edges[1:-1].reshape(-1, 2)
+    return _polyline_edges(self.point_count)
+
+  def edges_view(self):
+    """Returns a read-only memoryview of the edges of this polyline.
+
+    This is a zero-copy view of the same data as the edges property. It is
+    intended for callers which only iterate over the edges and do not need
+    a numpy array.
+
+    Returns
+    -------
+    memoryview
+      Read-only memoryview of format "I" and shape (edge_count, 2).
+
+    """
+    return memoryview(_polyline_edges(self.point_count))
 
   @property
   def edge_count(self):
@@ -213,8 +294,9 @@ class Polyline(Edge):
       raise DegenerateTopologyError(
         "Polyline objects must contain at least two points.")
     self._save_point_properties()
-    # Reconcile changes to ensure the edge arrays are the correct length.
-    self._reconcile_changes()
+    if self._points_assigned:
+      # Reconcile changes to ensure the edge arrays are the correct length.
+      self._reconcile_changes()
     self._save_edge_properties()
     self._reconcile_changes()
 
@@ -267,11 +349,22 @@ class Polygon(Edge):
 
   @property
   def edges(self):
-    edges = np.zeros(self.point_count * 2, dtype=ctypes.c_uint32)
-    temp = np.arange(1, self.point_count, dtype=ctypes.c_uint32)
-    edges[1:-1] = np.repeat(temp, 2)
-    edges.flags.writeable = False
-    return edges.reshape(-1, 2)
+    return _polygon_edges(self.point_count)
+
+  def edges_view(self):
+    """Returns a read-only memoryview of the edges of this polygon.
+
+    This is a zero-copy view of the same data as the edges property. It is
+    intended for callers which only iterate over the edges and do not need
+    a numpy array.
+
+    Returns
+    -------
+    memoryview
+      Read-only memoryview of format "I" and shape (edge_count, 2).
+
+    """
+    return memoryview(_polygon_edges(self.point_count))
 
   @property
   def edge_count(self):
@@ -291,7 +384,8 @@ class Polygon(Edge):
       raise DegenerateTopologyError(
         "Polygon objects must contain at least three points.")
     self._save_point_properties()
-    # Reconcile changes to ensure the edge arrays are the correct length.
-    self._reconcile_changes()
+    if self._points_assigned:
+      # Reconcile changes to ensure the edge arrays are the correct length.
+      self._reconcile_changes()
     self._save_edge_properties()
     self._reconcile_changes()
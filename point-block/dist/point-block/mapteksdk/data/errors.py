@@ -11,17 +11,19 @@ More specialised errors are placed in other modules.
 
 class ReadOnlyError(Exception):
   """Exception raised when operation fails due to being read-only"""
+  _default_args = ("Operation is not available in read-only mode",)
+  # BaseException.__new__ has already stored the arguments, so args is set
+  # directly rather than calling super().__init__().
+  # pylint: disable=super-init-not-called
   def __init__(self, message=None):
-    if message is None:
-      message = "Operation is not available in read-only mode"
-    super().__init__(message)
+    self.args = self._default_args if message is None else (message,)
 
 class CannotSaveInReadOnlyModeError(Exception):
   """Error raised when attempting to save an object in read only mode."""
+  _default_args = ("Cannot save objects in read only mode",)
+  # pylint: disable=super-init-not-called
   def __init__(self, message=None):
-    if message is None:
-      message = "Cannot save objects in read only mode"
-    super().__init__(message)
+    self.args = self._default_args if message is None else (message,)
 
 class DegenerateTopologyError(Exception):
   """Error raised when creating an object with degenerate topology."""
@@ -10,6 +10,7 @@ Image objects are used to apply complicated textures to other objects.
 
 import ctypes
 import logging
+import math
 import warnings
 
 import numpy as np
@@ -23,6 +24,68 @@ from .errors import CannotSaveInReadOnlyModeError
 
 log = logging.getLogger("mapteksdk.data")
 
+def _arrays_close(first, second):
+  """Returns True if two arrays have the same shape and are element-wise
+  equal within the default tolerance of np.isclose.
+
+  Arrays which are exactly equal are accepted without computing the
+  tolerances.
+
+  """
+  if first.shape != second.shape:
+    return False
+  if np.array_equal(first, second):
+    return True
+  return bool(np.allclose(first, second))
+
+def _coerce_point_array(value, point_dimension, point_type):
+  """Converts value to a contiguous array of points stored as doubles.
+
+  Parameters
+  ----------
+  value : array_like
+    The points to convert. None is treated as no points.
+  point_dimension : int
+    The number of components in each point.
+  point_type : str
+    The kind of point (e.g. "image") used in error messages.
+
+  Returns
+  -------
+  numpy.ndarray
+    Array of ctypes.c_double of shape (n, point_dimension).
+
+  Raises
+  ------
+  ValueError
+    If value is not two dimensional or the points have the wrong number of
+    components, or if a value cannot be converted to a float.
+  TypeError
+    If value cannot be converted to a numpy array.
+
+  """
+  if value is None:
+    return np.zeros((0, point_dimension), dtype=ctypes.c_double)
+  value = np.ascontiguousarray(value, dtype=ctypes.c_double)
+  if value.ndim != 2:
+    raise ValueError(f"{point_type.capitalize()} points must be two "
+                     f"dimensional, not {value.ndim} dimensional.")
+  if value.shape[1] != point_dimension:
+    raise ValueError(f"Each {point_type} point must have {point_dimension} "
+                     f"dimensions, not {value.shape[1]} dimensions.")
+  return value
+
+def _all_finite(vector):
+  """Returns True if every element of a small one dimensional array is
+  finite.
+
+  This avoids the ufunc dispatch and temporary arrays of
+  np.all(np.isfinite(vector)), which dominate for arrays of a few elements
+  such as the orientation of a registration.
+
+  """
+  return all(map(math.isfinite, vector.tolist()))
+
 class Raster(DataObject):
   """Class representing raster images which can be draped onto other objects.
 
@@ -103,18 +166,25 @@ class Raster(DataObject):
   @property
   def width(self):
     """The width of the raster. This is the number of pixels in each row."""
-    if self.__dimensions is None:
-      self.__dimensions = Visualisation().ReadRaster2DDimensions(
-        self._lock.lock)
-    return self.__dimensions[0]
+    return self.__load_dimensions()[0]
 
   @property
   def height(self):
     """The height of the raster. This is the number of pixels in each column."""
-    if self.__dimensions is None:
-      self.__dimensions = Visualisation().ReadRaster2DDimensions(
-        self._lock.lock)
-    return self.__dimensions[1]
+    return self.__load_dimensions()[1]
+
+  def __load_dimensions(self):
+    """Returns the dimensions of the raster as [width, height].
+
+    The dimensions are only read from the Project if they have not
+    already been cached.
+
+    """
+    dimensions = self.__dimensions
+    if dimensions is None:
+      dimensions = Visualisation().ReadRaster2DDimensions(self._lock.lock)
+      self.__dimensions = dimensions
+    return dimensions
 
   def resize(self, new_width, new_height, resize_image=True):
     """Resizes the raster to the new width and height.
@@ -174,11 +244,10 @@ class Raster(DataObject):
       raise ValueError(f"Invalid size for raster: {new_width}, {new_height}. "
                        "Width and height must be greater than zero.")
 
-    self.__dimensions = [new_width, new_height]
-
     if resize_image:
-      if self.width == new_width or self.height == new_height:
-        if Visualisation().version < (1, 3):
+      if Visualisation().version < (1, 3):
+        current_width, current_height = self.__load_dimensions()
+        if current_width == new_width or current_height == new_height:
           log.warning("There is a bug in PointStudio 2021 and other "
                       "applications where resizing an image without changing "
                       "both width and height is ignored.")
@@ -186,12 +255,16 @@ class Raster(DataObject):
       self.__pixels = None
       self.__error_on_access_pixels = True
     else:
-      self.__pixels = np.zeros((new_width * new_height, 4))
+      self.__pixels = np.zeros((new_width * new_height, 4),
+                               dtype=ctypes.c_uint8)
+    self.__dimensions = [new_width, new_height]
+    self.__pixels_2d = None
 
   @property
   def pixel_count(self):
     """The total number of pixels in the raster."""
-    return self.height * self.width
+    width, height = self.__load_dimensions()
+    return width * height
 
   @property
   def pixels(self):
@@ -233,21 +306,33 @@ class Raster(DataObject):
                          "resize_image = True. You must close the "
                          "object before accessing pixels.")
     if self.__pixels is None:
-      self.__pixels = np.array(
+      # The array returned by the C API is owned by Python and is kept alive
+      # by the numpy array, so it can be viewed rather than copied.
+      self.__pixels = np.frombuffer(
         Visualisation().GetRaster2DPixels(self._lock.lock),
         dtype=ctypes.c_uint8).reshape((-1, 4))
+      self.__pixels_2d = None
     if self.__pixels.shape != (self.pixel_count, 4):
       self.__pixels = convert_array_to_rgba(self.__pixels, self.pixel_count,
                                             np.array([0, 0, 0, 0]))
+      self.__pixels_2d = None
     return self.__pixels
 
   @pixels.setter
   def pixels(self, new_pixels):
-    if not isinstance(new_pixels, np.ndarray):
-      new_pixels = np.array(new_pixels)
-    new_pixels = convert_array_to_rgba(new_pixels, self.pixel_count,
-                                       np.array([0, 0, 0, 0]))
+    if (isinstance(new_pixels, np.ndarray)
+        and new_pixels.dtype == ctypes.c_uint8
+        and new_pixels.shape == (self.pixel_count, 4)):
+      # Already in the stored format, so only a copy is needed. The copy
+      # means later changes to the caller's array don't change the raster.
+      new_pixels = new_pixels.copy()
+    else:
+      if not isinstance(new_pixels, np.ndarray):
+        new_pixels = np.array(new_pixels)
+      new_pixels = convert_array_to_rgba(new_pixels, self.pixel_count,
+                                         np.array([0, 0, 0, 0]))
     self.__pixels = new_pixels
+    self.__pixels_2d = None
 
   @property
   def pixels_2d(self):
@@ -303,9 +388,12 @@ class Raster(DataObject):
     ...                                   half_width:width, 0] = 255
 
     """
-    if self.__pixels_2d is None or not np.may_share_memory(self.pixels,
-                                                           self.__pixels_2d):
-      self.__pixels_2d = self.pixels[:].reshape((self.height, self.width, 4))
+    # The cached view is discarded whenever the pixels array is replaced,
+    # so it is always a view of the current pixels.
+    pixels = self.pixels
+    if self.__pixels_2d is None:
+      width, height = self.__load_dimensions()
+      self.__pixels_2d = pixels[:].reshape((height, width, 4))
     return self.__pixels_2d
 
   @pixels_2d.setter
@@ -445,27 +533,21 @@ class Raster(DataObject):
       registration = Modelling().RasterGetRegistration(self._lock.lock)
       image_points, world_points, point_count, orientation = registration
 
-      image_points = self._array_to_numpy(image_points,
-                                          point_count * 2,
-                                          ctypes.c_double).reshape(-1, 2)
-      world_points = self._array_to_numpy(world_points,
-                                          point_count * 3,
-                                          ctypes.c_double).reshape(-1, 3)
-      orientation = self._array_to_numpy(orientation,
-                                         3,
-                                         ctypes.c_double)
+      image_points = self.__registration_array_to_numpy(
+        image_points, point_count * 2).reshape(-1, 2)
+      world_points = self.__registration_array_to_numpy(
+        world_points, point_count * 3).reshape(-1, 3)
+      orientation = self.__registration_array_to_numpy(orientation, 3)
       return RasterRegistrationTwoPoint(image_points,
                                         world_points,
                                         orientation)
     if registration_type == 6:
       registration = Modelling().RasterGetRegistration(self._lock.lock)
       image_points, world_points, point_count, _ = registration
-      image_points = self._array_to_numpy(image_points,
-                                          point_count * 2,
-                                          ctypes.c_double).reshape(-1, 2)
-      world_points = self._array_to_numpy(world_points,
-                                          point_count * 3,
-                                          ctypes.c_double).reshape(-1, 3)
+      image_points = self.__registration_array_to_numpy(
+        image_points, point_count * 2).reshape(-1, 2)
+      world_points = self.__registration_array_to_numpy(
+        world_points, point_count * 3).reshape(-1, 3)
       return RasterRegistrationMultiPoint(image_points, world_points)
     if registration_type == 8:
       # :TODO: Jayden Boskell 2021-04-22 SDK-484 Implement scan
@@ -473,6 +555,26 @@ class Raster(DataObject):
       return RasterRegistrationUnsupported()
     return RasterRegistrationUnsupported()
 
+  def __registration_array_to_numpy(self, c_array, count):
+    """Returns a numpy view of the first count doubles of a ctypes array
+    returned by Modelling().RasterGetRegistration().
+
+    Unlike _array_to_numpy() this does not copy the data. The ctypes array
+    is allocated by Python and is kept alive by the returned array, so it
+    remains valid after the object is closed.
+
+    Parameters
+    ----------
+    c_array : ctypes.Array
+      Array of ctypes.c_double to view.
+    count : int
+      The number of elements to include in the view.
+
+    """
+    array = np.frombuffer(c_array, dtype=ctypes.c_double, count=count)
+    array.setflags(write=self.lock_type is LockType.READWRITE)
+    return array
+
   def save(self):
     """Saves changes to the raster to the Project."""
     if not isinstance(self._lock, WriteLock):
@@ -480,8 +582,9 @@ class Raster(DataObject):
       log.error(error)
       raise error
     if self.__pixels is not None:
+      width, height = self.__load_dimensions()
       Visualisation().SetRaster2DPixels(self._lock.lock, self.pixels,
-                                        self.width, self.height)
+                                        width, height)
     if self.__registration is not None:
       registration = self.registration
       registration.raise_if_invalid()
@@ -641,20 +744,7 @@ class PointPairRegistrationBase(RasterRegistration):
 
   @image_points.setter
   def image_points(self, value):
-    if value is None:
-      value = np.zeros((0, 2), dtype=ctypes.c_double)
-    if not isinstance(value, np.ndarray):
-      value = np.array(value, dtype=ctypes.c_double)
-    if value.dtype != ctypes.c_double:
-      value = value.astype(ctypes.c_double)
-    if len(value.shape) != 2:
-      raise ValueError(f"Image points must be two dimensional, not "
-                       f"{len(value.shape)} dimensional.")
-    if value.shape[1] != 2:
-      raise ValueError(f"Each image point must have two dimensions, not "
-                       f"{value.shape[1]} dimensions.")
-
-    self.__image_points = value
+    self.__image_points = _coerce_point_array(value, 2, "image")
 
   @property
   def world_points(self):
@@ -679,20 +769,7 @@ class PointPairRegistrationBase(RasterRegistration):
 
   @world_points.setter
   def world_points(self, value):
-    if value is None:
-      value = np.zeros((0, 3), dtype=ctypes.c_double)
-    if not isinstance(value, np.ndarray):
-      value = np.array(value, dtype=ctypes.c_double)
-    if value.dtype != ctypes.c_double:
-      value = value.astype(ctypes.c_double)
-    if len(value.shape) != 2:
-      raise ValueError(f"World points must be two dimensional, not "
-                       f"{len(value.shape)} dimensional.")
-    if value.shape[1] != 3:
-      raise ValueError(f"Each world point must have 3 dimensions, not "
-                       f"{value.shape[1]} dimensions.")
-
-    self.__world_points = value
+    self.__world_points = _coerce_point_array(value, 3, "world")
 
 class RasterRegistrationTwoPoint(PointPairRegistrationBase):
   """Represents a simple raster registration which uses two points and
@@ -727,23 +804,25 @@ class RasterRegistrationTwoPoint(PointPairRegistrationBase):
   def is_valid(self):
     if not super().is_valid:
       return False
-    if not np.all(np.isfinite(self.orientation)):
+    if not _all_finite(self.orientation):
       return False
     return True
 
   def raise_if_invalid(self):
     super().raise_if_invalid()
-    if not np.all(np.isfinite(self.orientation)):
+    if not _all_finite(self.orientation):
       raise ValueError("Orientation must be finite. "
                        f"Orientation: {self.orientation}")
 
   def __eq__(self, other):
+    if self is other:
+      return True
     if not isinstance(other, RasterRegistrationTwoPoint):
       return False
 
-    return (np.all(np.isclose(self.image_points, other.image_points))
-            and np.all(np.isclose(self.world_points, other.world_points))
-            and np.all(np.isclose(self.orientation, other.orientation)))
+    return (_arrays_close(self.image_points, other.image_points)
+            and _arrays_close(self.world_points, other.world_points)
+            and _arrays_close(self.orientation, other.orientation))
 
   @property
   def orientation(self):
@@ -774,10 +853,7 @@ class RasterRegistrationTwoPoint(PointPairRegistrationBase):
   def orientation(self, value):
     if value is None:
       value = np.full((3,), np.nan, dtype=ctypes.c_double)
-    if not isinstance(value, np.ndarray):
-      value = np.array(value, dtype=ctypes.c_double)
-    if value.dtype != ctypes.c_double:
-      value = value.astype(ctypes.c_double)
+    value = np.ascontiguousarray(value, dtype=ctypes.c_double)
     if value.shape != (3,):
       raise ValueError("Orientation must have shape (3,), not: "
                        f"{value.shape}")
@@ -815,8 +891,10 @@ class RasterRegistrationMultiPoint(PointPairRegistrationBase):
     return 8
 
   def __eq__(self, other):
+    if self is other:
+      return True
     if not isinstance(other, RasterRegistrationMultiPoint):
       return False
 
-    return (np.all(np.isclose(self.image_points, other.image_points))
-            and np.all(np.isclose(self.world_points, other.world_points)))
+    return (_arrays_close(self.image_points, other.image_points)
+            and _arrays_close(self.world_points, other.world_points))
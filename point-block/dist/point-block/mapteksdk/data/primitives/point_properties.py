@@ -58,6 +58,8 @@ class PointProperties:
   __point_visibility = None
   __point_attributes = None
   __point_z = None
+  __points_assigned = False
+  __point_count = None
 
   @property
   def points(self):
@@ -138,12 +140,25 @@ class PointProperties:
   def points(self, points):
     if not self._can_set_points:
       raise AttributeError("Setting points is disabled for this object.")
+    self.__point_count = None
     if points is None:
       self.__points = None
     else:
       # Allow for list or ndarray as input
       self.__points = trim_pad_2d_array(points, -1, 3, 0).astype(
         ctypes.c_double)
+      self.__points_assigned = True
+
+  @property
+  def _points_assigned(self):
+    """True if the points have been assigned, or removal of points has been
+    requested, since the properties were last invalidated.
+
+    These are the only ways to change the point count. If this is False
+    the arrays of the other primitives are already the correct length.
+
+    """
+    return self.__points_assigned
 
   @property
   def point_z(self):
@@ -283,9 +298,11 @@ class PointProperties:
   def point_count(self):
     """The number of points in the object."""
     # If points haven't been loaded, load point count from
-    # the Project. Otherwise derive it.
+    # the Project (once per invalidation). Otherwise derive it.
     if self.__points is None:
-      return self._get_point_count()
+      if self.__point_count is None:
+        self.__point_count = self._get_point_count()
+      return self.__point_count
     return self.points.shape[0]
 
   def _invalidate_properties(self):
@@ -299,6 +316,8 @@ class PointProperties:
     self.__point_visibility = None
     self.__point_attributes = None
     self.__point_z = None
+    self.__points_assigned = False
+    self.__point_count = None
 
   def remove_points(self, point_indices, update_immediately=True):
     """Remove one or more points. This is done directly in the project
@@ -328,8 +347,14 @@ class PointProperties:
       remove_request = self._remove_point(point_indices)
     else:
       remove_request = self._remove_points(point_indices)
-    if remove_request and update_immediately:
-      self._invalidate_properties()
+    self.__point_count = None
+    if remove_request:
+      if update_immediately:
+        self._invalidate_properties()
+      else:
+        # The point count will change when the object is saved so the
+        # arrays of the other primitives need to be reconciled.
+        self.__points_assigned = True
     return remove_request
 
   def _save_point_properties(self):